@@ -11,32 +11,75 @@
 """
 
 import logging
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
 import requests
-import json
+from cachetools import LRUCache
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict
+from types import SimpleNamespace
+from typing import List, Optional, Any, Dict, Tuple
 from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
 
+class EmbeddingError(Exception):
+    """埋め込み取得の失敗。例外で通知することで失敗結果をキャッシュしない。"""
+
+
+# 検索クエリ埋め込みのキャッシュ: (プロバイダ型, 接続先・埋め込みモデル, テキスト) -> array('d')
+# 同じ課題本文での再検索 (アドバイス再生成など) で埋め込み API を呼ばずに済む。
+# キーにインスタンスを含めないので、設定が同じ新しいプロバイダとも共有され、古いインスタンスを保持しない。
+# float の tuple ではなく array('d') で保持しメモリを抑える。
+_query_embedding_cache: LRUCache = LRUCache(maxsize=512)
+_query_embedding_cache_lock = threading.Lock()
+
+
 class AIProvider(ABC):
     """AI プロバイダの基底クラス。"""
     
+    embedding_model: str
+    default_dimension: int
+    
     @abstractmethod
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """複数テキストを埋め込みベクトルへ変換。"""
         pass
     
-    @abstractmethod
     def embed_query(self, text: str) -> List[float]:
-        """検索クエリを埋め込みベクトルへ変換。"""
+        """検索クエリを埋め込みベクトルへ変換（結果はキャッシュされる）。"""
+        key = (type(self), self._identity(), text)
+        with _query_embedding_cache_lock:
+            vec = _query_embedding_cache.get(key)
+        if vec is None:
+            try:
+                vec = array('d', self._fetch_query_embedding(text))
+            except EmbeddingError:
+                # 失敗結果はキャッシュしない
+                return [0.0] * self.default_dimension
+            with _query_embedding_cache_lock:
+                _query_embedding_cache[key] = vec
+        # キャッシュヒット時は _get_embedding が呼ばれないため、ここで次元を反映する
+        self.default_dimension = len(vec)
+        return vec.tolist()
+    
+    @abstractmethod
+    def _fetch_query_embedding(self, text: str) -> List[float]:
+        """検索クエリの埋め込みを API から取得。失敗時は EmbeddingError。"""
         pass
     
     @abstractmethod
     def generate_completion(self, prompt: str) -> Optional[str]:
         """プロンプトから回答を生成。"""
         pass
+    
+    @abstractmethod
+    def _identity(self) -> tuple:
+        """接続先と埋め込みモデルを表す値。同じ値のインスタンスは埋め込みキャッシュを共有する。"""
+        pass
 
 
 class OllamaProvider(AIProvider):
@@ -50,24 +93,27 @@ class OllamaProvider(AIProvider):
         self.embedding_model = embedding_model
         # 一旦仮の初期値。実際の次元は最初の API 呼び出しで上書きする。
         self.default_dimension = 384
+        # 接続を使い回す（keep-alive）
+        self.session = requests.Session()
         logger.info(f"Initialized Ollama provider: {self.base_url}, model: {self.model}")
     
+    def _identity(self) -> tuple:
+        return (self.base_url, self.embedding_model)
+    
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """複数テキストを埋め込みベクトルへ変換。"""
-        embeddings = []
-        for text in texts:
-            embedding = self._get_embedding(text)
-            if embedding:
-                embeddings.append(embedding)
-            else:
-                # Fallback to zeros if embedding fails
-                embeddings.append([0.0] * self.default_dimension)
-        return embeddings
+        # Ollama の embeddings API は1件ずつなので並列に呼び出す（順序は維持）
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self._get_embedding, texts))
+        # Fallback to zeros if embedding fails
+        return [embedding or [0.0] * self.default_dimension for embedding in results]
     
-    def embed_query(self, text: str) -> List[float]:
-        """検索クエリを埋め込みベクトルへ変換。"""
+    def _fetch_query_embedding(self, text: str) -> List[float]:
+        """検索クエリの埋め込みを API から取得。"""
         embedding = self._get_embedding(text)
-        return embedding if embedding else [0.0] * self.default_dimension
+        if not embedding:
+            raise EmbeddingError("Ollama embedding unavailable")
+        return embedding
     
     def generate_completion(self, prompt: str) -> Optional[str]:
         """プロンプトから回答を生成。"""
@@ -78,9 +124,9 @@ class OllamaProvider(AIProvider):
                 "prompt": prompt,
                 "stream": False
             }
-            response = requests.post(url, json=data, timeout=120)
+            response = self.session.post(url, json=data, timeout=120)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             return result.get("response")
         except Exception as e:
             logger.error(f"Failed to generate completion with Ollama: {e}")
@@ -94,9 +140,9 @@ class OllamaProvider(AIProvider):
                 "model": self.embedding_model,
                 "prompt": text
             }
-            response = requests.post(url, json=data, timeout=30)
+            response = self.session.post(url, json=data, timeout=30)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             emb = result.get("embedding")
             if emb and isinstance(emb, list):
                 dim = len(emb)
@@ -131,10 +177,15 @@ class OpenAIProvider(AIProvider):
         if base_url:
             client_kwargs["base_url"] = base_url
         
+        self.base_url = base_url
+        self._api_key = api_key
         self.client = OpenAI(**client_kwargs)
         self.default_dimension = 1536  # Default for text-embedding-3-small
         logger.info(f"Initialized OpenAI provider: model: {model}, embedding: {embedding_model}")
     
+    def _identity(self) -> tuple:
+        return (self.base_url, self._api_key, self.embedding_model)
+    
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """複数テキストを埋め込みベクトルへ変換。"""
         try:
@@ -149,8 +200,8 @@ class OpenAIProvider(AIProvider):
             # Fallback to zeros
             return [[0.0] * self.default_dimension for _ in texts]
     
-    def embed_query(self, text: str) -> List[float]:
-        """検索クエリを埋め込みベクトルへ変換。"""
+    def _fetch_query_embedding(self, text: str) -> List[float]:
+        """検索クエリの埋め込みを API から取得。"""
         try:
             response = self.client.embeddings.create(
                 input=[text],
@@ -159,7 +210,7 @@ class OpenAIProvider(AIProvider):
             return response.data[0].embedding
         except Exception as e:
             logger.error(f"Failed to get embedding from OpenAI: {e}")
-            return [0.0] * self.default_dimension
+            raise EmbeddingError(str(e)) from e
     
     def generate_completion(self, prompt: str) -> Optional[str]:
         """プロンプトから回答を生成。"""
@@ -209,3 +260,31 @@ def create_ai_provider(provider_type: str, config: Any) -> AIProvider:
         )
     else:
         raise ValueError(f"Unsupported AI provider: {provider_type}")
+
+
+# プロバイダ生成に使う設定項目（これらが同じならインスタンスを使い回せる）
+_PROVIDER_CONFIG_FIELDS = {
+    "ollama": ("ollama_base_url", "ollama_model", "ollama_embedding_model"),
+    "openai": ("openai_api_key", "openai_model", "openai_embedding_model", "openai_base_url"),
+}
+
+
+@lru_cache(maxsize=8)
+def _cached_provider(provider_type: str, settings: Tuple[Tuple[str, Any], ...]) -> AIProvider:
+    """設定値の組ごとにプロバイダを1つだけ生成。"""
+    return create_ai_provider(provider_type, SimpleNamespace(**dict(settings)))
+
+
+def get_ai_provider(provider_type: str, config: Any) -> AIProvider:
+    """create_ai_provider と同じだが、同じ設定ならプロバイダを使い回す。
+    
+    HTTP クライアント（接続プール・TLS セッション）を毎回作り直さずに済む。
+    
+    Raises:
+        ValueError: 不正なプロバイダタイプまたは設定不備
+    """
+    key = provider_type.lower()
+    fields = _PROVIDER_CONFIG_FIELDS.get(key)
+    if fields is None:
+        raise ValueError(f"Unsupported AI provider: {provider_type}")
+    return _cached_provider(key, tuple((field, getattr(config, field)) for field in fields))
@@ -1,7 +1,6 @@
 """FastAPI web application for Redmine issue analysis and advice API."""
 
 import logging
-import os
 import sys
 from contextlib import asynccontextmanager
 from typing import Dict, Any
@@ -13,7 +12,7 @@ from .config import config
 from .redmine_client import RedmineClient
 from .rag_service import RAGService
 from .scheduler import UpdateScheduler
-from .web_routes import web_router
+from .web_routes import web_router, set_dependencies
 
 # Configure logging
 logging.basicConfig(
@@ -60,7 +59,6 @@ async def lifespan(app: FastAPI):
     scheduler.start()
     
     # Set up dependencies for web routes
-    from .web_routes import set_dependencies
     set_dependencies(rag_service, redmine_client)
     
     logger.info("RemindMine AI Agent started successfully")
@@ -215,7 +213,7 @@ def main():
     # デバッグモード判定
     debug_mode = (
         "--debug" in sys.argv or 
-        os.getenv("DEBUG") == "1" or
+        config.debug or
         any("debugpy" in module for module in sys.modules.keys())
     )
     
@@ -53,6 +53,9 @@ class Config(BaseModel):
     
     # SSL settings
     ssl_verify: bool = os.getenv("SSL_VERIFY", "true").lower() == "true"
+    
+    # Debug settings (code/template auto-reload)
+    debug: bool = os.getenv("DEBUG", "0") == "1"
 
 
 # Global config instance
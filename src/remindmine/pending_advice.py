@@ -1,8 +1,10 @@
 """Pending advice management for RemindMine."""
 
+import hashlib
 import logging
 import json
 import os
+import time
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
@@ -25,6 +27,20 @@ class PendingAdvice:
     tracker_name: str
     priority_name: str
     status_name: str
+    content_key: str = ""  # Hash of the issue content the advice was generated from
+    
+    @staticmethod
+    def content_key_for(issue: Dict[str, Any]) -> str:
+        """Hash the issue content that advice depends on (id, subject, description, latest journal)."""
+        journals = issue.get('journals') or ()
+        last_journal_time = (journals[-1].get('created_on') or '') if journals else ''
+        content = "\x00".join((
+            str(issue.get('id')),
+            issue.get('subject') or '',
+            issue.get('description') or '',
+            last_journal_time,
+        ))
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
     
     @classmethod
     def from_issue_and_advice(cls, issue: Dict[str, Any], advice: str) -> 'PendingAdvice':
@@ -44,8 +60,13 @@ class PendingAdvice:
             tracker_name=issue.get('tracker', {}).get('name', 'Unknown'),
             priority_name=issue.get('priority', {}).get('name', 'Unknown'),
             status_name=issue.get('status', {}).get('name', 'Unknown'),
+            content_key=cls.content_key_for(issue),
         )
     
+    def age_seconds(self) -> float:
+        """Seconds elapsed since this advice was created."""
+        return (datetime.now(timezone.utc) - datetime.fromisoformat(self.created_at)).total_seconds()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return asdict(self)
@@ -62,8 +83,15 @@ class PendingAdviceManager:
         """
         self.storage_file = storage_file
         self._pending_advice: Dict[str, PendingAdvice] = {}
+        # Bumped on every change; seeded from the clock so it never repeats across restarts
+        self._version = time.time_ns()
         self._load_from_storage()
     
+    @property
+    def version(self) -> int:
+        """Change counter for the pending advice set (used as the ETag of the list endpoint)."""
+        return self._version
+    
     def add_pending_advice(self, issue: Dict[str, Any], advice: str) -> str:
         """Add new pending advice.
         
@@ -199,6 +227,8 @@ class PendingAdviceManager:
     
     def _save_to_storage(self):
         """Save pending advice to storage file."""
+        # Every mutation persists through here, so this is where the set changes version
+        self._version += 1
         try:
             # Ensure data directory exists
             os.makedirs(os.path.dirname(self.storage_file), exist_ok=True)
@@ -37,6 +37,10 @@ class RAGService:
         """課題一覧をインデックス（indexerに転送）。"""
         return self.indexer.index_issues(issues, full_rebuild)
     
+    def index_issue_batches(self, batches, full_rebuild=False):
+        """課題をバッチ単位でインデックス（indexerに転送）。"""
+        return self.indexer.index_issue_batches(batches, full_rebuild)
+    
     def search_similar_issues(self, query, n_results=5, exclude_issue_id=None):
         """類似課題検索（searcherに転送）。"""
         return self.searcher.search_similar_issues(query, n_results, exclude_issue_id)
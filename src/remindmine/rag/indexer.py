@@ -14,7 +14,7 @@ ChromaDBは「ベクトルデータベース」の一種で、以下の特徴が
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Set, Tuple
 import hashlib
 import json
 
@@ -137,6 +137,16 @@ class RAGIndexer(RAGBase):
         if not issues:
             return 0
 
+        _, added_chunk_total = self.index_issue_batches([issues], full_rebuild)
+        return added_chunk_total
+
+    def index_issue_batches(self, batches: Iterable[List[Dict[str, Any]]], full_rebuild: bool = False) -> Tuple[int, int]:
+        """課題をバッチ単位で差分インデックス。戻り値は (処理した課題数, 追加したチャンク数)。
+        
+        全件をメモリに載せずに済むよう、バッチごとにチャンク分割・埋め込み・保存を行う。
+        削除された課題のクリーンアップは全バッチを処理した後、見つかった課題IDの集合で行う
+        （途中のバッチだけを見て他の課題を削除しないため）。
+        """
         current_embedding_model = getattr(self.ai_provider, 'embedding_model', 'unknown')
         expected_dim = getattr(self.ai_provider, 'default_dimension', None)
         state = self._load_index_state()
@@ -160,11 +170,21 @@ class RAGIndexer(RAGBase):
             state['issues'] = {}
 
         issue_state: Dict[str, Any] = state.get('issues', {})
-        latest_issue_ids = {str(i['id']) for i in issues}
-        existing_issue_ids = set(issue_state.keys())
+        latest_issue_ids: Set[str] = set()
+        added_chunk_total = 0
+
+        for issues in batches:
+            if not issues:
+                continue
+            latest_issue_ids.update(str(i['id']) for i in issues)
+            added_chunk_total += self._index_batch(issues, issue_state, full_rebuild)
+
+        # 1件も取得できなかった場合は（取得失敗の可能性があるため）削除も状態保存も行わない
+        if not latest_issue_ids:
+            return 0, 0
 
         # 削除された issue のクリーンアップ
-        removed_issue_ids = existing_issue_ids - latest_issue_ids
+        removed_issue_ids = set(issue_state.keys()) - latest_issue_ids
         for rid in removed_issue_ids:
             try:
                 # 【ChromaDB初学者向け】
@@ -175,10 +195,23 @@ class RAGIndexer(RAGBase):
             except Exception:
                 pass
 
+        # 状態保存
+        state['issues'] = issue_state
+        state['embedding_model'] = current_embedding_model
+        state['embedding_dimension'] = expected_dim
+        self._save_index_state(state)
+
+        return len(latest_issue_ids), added_chunk_total
+
+    def _index_batch(self, issues: List[Dict[str, Any]], issue_state: Dict[str, Any], full_rebuild: bool) -> int:
+        """1バッチ分の課題をチャンク分割・埋め込みして保存。戻り値は追加したチャンク数。
+        
+        埋め込みに失敗したバッチの課題は issue_state に記録しない（次回の更新で再試行される）。
+        """
         documents: List[str] = []
         metadatas: List[Dict[str, Any]] = []
         ids: List[str] = []
-        added_chunk_total = 0
+        batch_state: Dict[str, Any] = {}
 
         for issue in issues:
             issue_id_str = str(issue['id'])
@@ -224,9 +257,8 @@ class RAGIndexer(RAGBase):
                     "source_updated_on": issue_updated_on,
                 })
                 ids.append(doc_id)
-            added_chunk_total += len(chunks)
 
-            issue_state[issue_id_str] = {
+            batch_state[issue_id_str] = {
                 "hash": issue_hash,
                 "chunk_count": len(chunks),
                 "updated_on": issue_updated_on,
@@ -259,13 +291,8 @@ class RAGIndexer(RAGBase):
                 logger.error(f"Failed to embed documents: {e}")
                 return 0
 
-        # 状態保存
-        state['issues'] = issue_state
-        state['embedding_model'] = current_embedding_model
-        state['embedding_dimension'] = expected_dim
-        self._save_index_state(state)
-
-        return added_chunk_total
+        issue_state.update(batch_state)
+        return len(documents)
 
     def get_index_stats(self) -> Dict[str, Any]:
         """インデックスの統計情報を取得。
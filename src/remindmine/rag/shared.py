@@ -11,7 +11,7 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 import os
 
 from ..config import config
-from ..ai_providers import create_ai_provider
+from ..ai_providers import get_ai_provider
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ class RAGBase:
             provider_type = config.ai_provider
         
         try:
-            self.ai_provider = create_ai_provider(provider_type, config)
+            self.ai_provider = get_ai_provider(provider_type, config)
             logger.info(f"Initialized AI provider: {provider_type}")
         except Exception as e:
             logger.error(f"Failed to initialize AI provider {provider_type}: {e}")
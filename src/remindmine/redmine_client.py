@@ -1,17 +1,45 @@
 """Redmine API client for fetching issues and posting comments."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import threading
+from cachetools import TTLCache
+import orjson
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _cached_reference(method):
+    """Cache a reference-data getter (projects, trackers, ...) in the client's TTL cache.
+    
+    Empty results are not cached, since the getters return [] on failure.
+    """
+    @wraps(method)
+    def wrapper(self):
+        key = method.__name__
+        with self._reference_lock:
+            cached = self._reference_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = method(self)
+        if result:
+            with self._reference_lock:
+                self._reference_cache[key] = result
+        return result
+    return wrapper
+
+
 class RedmineClient:
     """Redmine API client."""
 
-    def __init__(self, base_url: str, api_key: str, disable_proxy: bool = False, ssl_verify: bool = True):
+    def __init__(self, base_url: str, api_key: str, disable_proxy: bool = False, ssl_verify: bool = True,
+                 reference_cache_ttl: float = 3600):
         """Initialize Redmine client.
 
         Args:
@@ -19,10 +47,16 @@ class RedmineClient:
             api_key: Redmine API key
             disable_proxy: If True, ignore system / environment proxies
             ssl_verify: If False, ignore SSL certificate verification
+            reference_cache_ttl: Seconds to cache projects, trackers, priorities,
+                users and statuses
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        # Room for the concurrent detail fetches (iter_issues_with_journals, web endpoints)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'X-Redmine-API-Key': api_key,
             'Content-Type': 'application/json'
@@ -38,6 +72,10 @@ class RedmineClient:
         
         # Store last retrieved total_count for pagination purposes
         self.last_total_count = 0
+        
+        # Reference data (projects, trackers, ...) rarely changes
+        self._reference_cache: TTLCache = TTLCache(maxsize=16, ttl=reference_cache_ttl)
+        self._reference_lock = threading.Lock()
 
         if disable_proxy:
             # Clear proxy-related environment variables for this session only
@@ -47,11 +85,25 @@ class RedmineClient:
             self.session.trust_env = False
             logger.info("RedmineClient: Proxy disabled for session")
     
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """Decode a JSON response body with orjson.
+        
+        Decode errors are raised as RequestException so callers' existing
+        error handling still applies.
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.RequestException(f"Invalid JSON response: {e}", response=response)
+    
     def get_issues(self, 
                    project_id: Optional[int] = None,
                    status_id: Optional[str] = None,
                    limit: int = 100,
-                   offset: int = 0) -> List[Dict[str, Any]]:
+                   offset: int = 0,
+                   include: Optional[str] = 'journals',
+                   issue_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """Get issues from Redmine.
         
         Args:
@@ -59,33 +111,60 @@ class RedmineClient:
             status_id: Status ID to filter by ('*' for all)
             limit: Number of issues to fetch
             offset: Offset for pagination
+            include: Associated data to include (e.g. 'journals'), None for none
+            issue_ids: Restrict the result to these issue IDs (single request)
             
         Returns:
             List of issue dictionaries
         """
+        issues, _ = self.get_issues_with_total(project_id, status_id, limit, offset, include, issue_ids)
+        return issues
+
+    def get_issues_with_total(self, 
+                              project_id: Optional[int] = None,
+                              status_id: Optional[str] = None,
+                              limit: int = 100,
+                              offset: int = 0,
+                              include: Optional[str] = 'journals',
+                              issue_ids: Optional[List[int]] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Get issues from Redmine together with the total number of matching issues.
+        
+        Unlike reading ``last_total_count`` after ``get_issues``, the total is
+        returned with the page, so concurrent requests cannot mix them up.
+        
+        Args:
+            Same as ``get_issues``
+            
+        Returns:
+            Tuple of (list of issue dictionaries, total_count)
+        """
         url = f"{self.base_url}/issues.json"
         params = {
             'limit': limit,
-            'offset': offset,
-            'include': 'journals'
+            'offset': offset
         }
         
+        if include:
+            params['include'] = include
         if project_id:
             params['project_id'] = project_id
         if status_id:
             params['status_id'] = status_id
+        if issue_ids:
+            params['issue_id'] = ','.join(str(issue_id) for issue_id in issue_ids)
             
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             issues = data.get('issues', [])
-            # Store total_count from Redmine API for pagination
-            self.last_total_count = data.get('total_count', len(issues))
-            return issues
+            total_count = data.get('total_count', len(issues))
+            # Kept for callers that read the total after get_issues()
+            self.last_total_count = total_count
+            return issues, total_count
         except requests.RequestException as e:
             logger.error(f"Failed to fetch issues: {e}")
-            return []
+            return [], 0
     
     def get_issue(self, issue_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific issue.
@@ -102,12 +181,60 @@ class RedmineClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             return data.get('issue')
         except requests.RequestException as e:
             logger.error(f"Failed to fetch issue {issue_id}: {e}")
             return None
     
+    def get_issues_by_ids(self, issue_ids: List[int], include: str = 'journals') -> List[Dict[str, Any]]:
+        """Get several issues with one list request using the ``issue_id`` filter.
+        
+        Redmine versions that ignore ``include=journals`` on the list endpoint
+        return issues without a ``journals`` key; only those are re-fetched
+        individually (concurrently) so the result carries journals when requested.
+        
+        Args:
+            issue_ids: Issue IDs to fetch
+            include: Associated data to include
+            
+        Returns:
+            List of issue dictionaries in the order of ``issue_ids``
+        """
+        if not issue_ids:
+            return []
+        
+        # Redmine caps list responses at 100 issues per request
+        issues_by_id = {}
+        for start in range(0, len(issue_ids), 100):
+            chunk = issue_ids[start:start + 100]
+            issues = self.get_issues(
+                status_id='*',
+                limit=len(chunk),
+                include=include,
+                issue_ids=chunk
+            )
+            issues_by_id.update((issue['id'], issue) for issue in issues)
+        
+        if include == 'journals':
+            self._fill_missing_journals(issues_by_id)
+        return [issues_by_id[issue_id] for issue_id in issue_ids if issue_id in issues_by_id]
+    
+    def _fill_missing_journals(self, issues_by_id: Dict[int, Dict[str, Any]]):
+        """Replace issues that came back without journals by their detail (fetched concurrently).
+        
+        Stock Redmine ignores ``include=journals`` on the list endpoint, so this
+        is usually one detail request per issue; issues whose detail fetch fails
+        are kept as they are.
+        """
+        missing_ids = [issue_id for issue_id, issue in issues_by_id.items() if 'journals' not in issue]
+        if not missing_ids:
+            return
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for issue_id, issue in zip(missing_ids, executor.map(self.get_issue, missing_ids)):
+                if issue:
+                    issues_by_id[issue_id] = issue
+    
     def add_comment(self, issue_id: int, notes: str) -> bool:
         """Add a comment to an issue.
         
@@ -134,49 +261,58 @@ class RedmineClient:
             logger.error(f"Failed to add comment to issue {issue_id}: {e}")
             return False
     
-    def get_all_issues_with_journals(self) -> List[Dict[str, Any]]:
-        """Get all issues with their journals for RAG indexing.
+    def iter_issues_with_journals(self, batch_size: int = 200) -> Iterator[List[Dict[str, Any]]]:
+        """Yield all issues with their journals in batches for RAG indexing.
         
         Note: Redmine API does not support including journals in bulk issue retrieval.
-        This method fetches issue IDs first, then retrieves each issue individually.
+        Issue IDs are paged in without journals, and each batch of details is fetched
+        concurrently so only one batch is held in memory at a time.
         
-        Returns:
-            List of issues with journals
+        Args:
+            batch_size: Number of issues per yielded batch
+            
+        Yields:
+            Lists of issues with journals
         """
-        # First, get all issue IDs without journals (faster)
-        all_issue_ids = []
         offset = 0
         limit = 100
-        
-        logger.info("Fetching all issue IDs...")
-        while True:
-            issues = self.get_issues(status_id='*', limit=limit, offset=offset)
-            if not issues:
-                break
+        pending_ids: List[int] = []
+        fetched = 0
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            while True:
+                issues = self.get_issues(status_id='*', limit=limit, offset=offset, include=None)
+                pending_ids.extend(issue['id'] for issue in issues)
+                last_page = len(issues) < limit
                 
-            # Extract just the IDs
-            issue_ids = [issue['id'] for issue in issues]
-            all_issue_ids.extend(issue_ids)
-            
-            if len(issues) < limit:
-                break
+                while pending_ids and (last_page or len(pending_ids) >= batch_size):
+                    batch_ids, pending_ids = pending_ids[:batch_size], pending_ids[batch_size:]
+                    batch = []
+                    for issue_id, issue in zip(batch_ids, executor.map(self.get_issue, batch_ids)):
+                        if issue:
+                            batch.append(issue)
+                        else:
+                            logger.warning(f"Failed to fetch details for issue #{issue_id}")
+                    fetched += len(batch)
+                    logger.info(f"Fetched issue details: {fetched} so far")
+                    yield batch
                 
-            offset += limit
-        
-        logger.info(f"Found {len(all_issue_ids)} issues. Fetching detailed data with journals...")
-        
-        # Now fetch each issue individually to get journals
-        all_issues_with_journals = []
-        for i, issue_id in enumerate(all_issue_ids, 1):
-            if i % 10 == 0:  # Progress logging
-                logger.info(f"Fetching issue details: {i}/{len(all_issue_ids)}")
-            
-            issue = self.get_issue(issue_id)
-            if issue:
-                all_issues_with_journals.append(issue)
-            else:
-                logger.warning(f"Failed to fetch details for issue #{issue_id}")
+                if last_page:
+                    break
+                offset += limit
+
+    def get_all_issues_with_journals(self) -> List[Dict[str, Any]]:
+        """Get all issues with their journals for RAG indexing.
         
+        Returns:
+            List of issues with journals
+        """
+        logger.info("Fetching all issues with journals...")
+        all_issues_with_journals = [
+            issue
+            for batch in self.iter_issues_with_journals()
+            for issue in batch
+        ]
         logger.info(f"Successfully fetched {len(all_issues_with_journals)} issues with journals")
         return all_issues_with_journals
 
@@ -185,7 +321,7 @@ class RedmineClient:
         
         Args:
             since_datetime: Datetime to filter issues from
-            include_journals: If True, fetch journals for each issue individually
+            include_journals: If True, fetch journals for the issues (details fetched concurrently when missing)
             
         Returns:
             List of new issues (with journals if include_journals=True)
@@ -199,26 +335,23 @@ class RedmineClient:
             'sort': 'created_on:desc',
             'limit': 100
         }
+        if include_journals:
+            params['include'] = 'journals'
         
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             issues = data.get('issues', [])
             logger.info(f"Found {len(issues)} issues created since {since_str}")
             
-            # If journals are needed, fetch each issue individually
+            # If the server left journals out of the list, fetch the missing ones
             if include_journals and issues:
                 logger.info(f"Fetching journals for {len(issues)} new issues...")
-                issues_with_journals = []
-                for issue in issues:
-                    detailed_issue = self.get_issue(issue['id'])
-                    if detailed_issue:
-                        issues_with_journals.append(detailed_issue)
-                    else:
-                        # Fallback to original issue data if detailed fetch fails
-                        issues_with_journals.append(issue)
-                return issues_with_journals
+                issues_by_id = {issue['id']: issue for issue in issues}
+                # Issues whose detail fetch fails keep the list data
+                self._fill_missing_journals(issues_by_id)
+                return [issues_by_id[issue['id']] for issue in issues]
             
             return issues
         except requests.RequestException as e:
@@ -240,7 +373,7 @@ class RedmineClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             issues = data.get('issues', [])
             
             if issues:
@@ -278,6 +411,7 @@ class RedmineClient:
             logger.error(f"Failed to check AI comment for issue {issue_id}: {e}")
             return False
 
+    @_cached_reference
     def get_projects(self) -> List[Dict[str, Any]]:
         """Get all projects from Redmine.
         
@@ -290,12 +424,13 @@ class RedmineClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             return data.get('projects', [])
         except requests.RequestException as e:
             logger.error(f"Failed to fetch projects: {e}")
             return []
 
+    @_cached_reference
     def get_trackers(self) -> List[Dict[str, Any]]:
         """Get all trackers from Redmine.
         
@@ -307,12 +442,13 @@ class RedmineClient:
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             return data.get('trackers', [])
         except requests.RequestException as e:
             logger.error(f"Failed to fetch trackers: {e}")
             return []
 
+    @_cached_reference
     def get_priorities(self) -> List[Dict[str, Any]]:
         """Get all issue priorities from Redmine.
         
@@ -324,12 +460,13 @@ class RedmineClient:
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             return data.get('issue_priorities', [])
         except requests.RequestException as e:
             logger.error(f"Failed to fetch priorities: {e}")
             return []
 
+    @_cached_reference
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users from Redmine.
         
@@ -342,12 +479,13 @@ class RedmineClient:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             return data.get('users', [])
         except requests.RequestException as e:
             logger.error(f"Failed to fetch users: {e}")
             return []
 
+    @_cached_reference
     def get_statuses(self) -> List[Dict[str, Any]]:
         """Get all issue statuses from Redmine.
         
@@ -359,12 +497,17 @@ class RedmineClient:
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             return data.get('issue_statuses', [])
         except requests.RequestException as e:
             logger.error(f"Failed to fetch issue statuses: {e}")
             return []
 
+    def clear_reference_cache(self) -> None:
+        """Drop cached projects, trackers, priorities, users and statuses."""
+        with self._reference_lock:
+            self._reference_cache.clear()
+
     def create_issue(self, 
                     project_id: int,
                     tracker_id: int,
@@ -405,7 +548,7 @@ class RedmineClient:
         try:
             response = self.session.post(url, json=payload)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             issue_id = data["issue"]["id"]
             logger.info(f"Created issue #{issue_id}: {subject}")
             return issue_id
@@ -144,12 +144,7 @@ class RemindMineApp {
     async loadInitialData() {
         try {
             await Promise.all([
-                this.loadProjects(),
-                this.loadTrackers(),
-                this.loadPriorities(),
-                this.loadStatuses(),
-                this.loadUsers(),
-                this.loadSettings(),
+                this.loadBootstrap(),
                 this.loadCacheStats(),
                 this.loadAIProviderConfig()
             ]);
@@ -476,63 +471,19 @@ class RemindMineApp {
         document.getElementById('next-page').disabled = pagination.current_page >= pagination.total_pages;
     }
 
-    async loadProjects() {
+    async loadBootstrap() {
+        // プロジェクト・優先度・ステータス・設定を1回のリクエストでまとめて取得
         try {
-            const response = await fetch('/api/web/projects');
-            if (!response.ok) throw new Error('Failed to fetch projects');
+            const response = await fetch('/api/web/bootstrap');
+            if (!response.ok) throw new Error('Failed to fetch bootstrap data');
             
-            const projects = await response.json();
-            this.populateSelect('project-filter', projects, 'id', 'name', '全プロジェクト');
-        } catch (error) {
-            console.error('Failed to load projects:', error);
-        }
-    }
-
-    async loadTrackers() {
-        try {
-            const response = await fetch('/api/web/trackers');
-            if (!response.ok) throw new Error('Failed to fetch trackers');
-            
-            const trackers = await response.json();
-            // issue-tracker セレクトは廃止
-        } catch (error) {
-            console.error('Failed to load trackers:', error);
-        }
-    }
-
-    async loadPriorities() {
-        try {
-            const response = await fetch('/api/web/priorities');
-            if (!response.ok) throw new Error('Failed to fetch priorities');
-            
-            const priorities = await response.json();
-            this.populateSelect('priority-filter', priorities, 'id', 'name', '全優先度');
-        } catch (error) {
-            console.error('Failed to load priorities:', error);
-        }
-    }
-
-    async loadStatuses() {
-        try {
-            const response = await fetch('/api/web/statuses');
-            if (!response.ok) throw new Error('Failed to fetch statuses');
-            
-            const statuses = await response.json();
-            this.populateSelect('status-filter', statuses, 'id', 'name', '全ステータス');
-        } catch (error) {
-            console.error('Failed to load statuses:', error);
-        }
-    }
-
-    async loadUsers() {
-        try {
-            const response = await fetch('/api/web/users');
-            if (!response.ok) throw new Error('Failed to fetch users');
-            
-            const users = await response.json();
-            // issue-assignee セレクトは廃止
+            const data = await response.json();
+            this.populateSelect('project-filter', data.projects, 'id', 'name', '全プロジェクト');
+            this.populateSelect('priority-filter', data.priorities, 'id', 'name', '全優先度');
+            this.populateSelect('status-filter', data.statuses, 'id', 'name', '全ステータス');
+            this.applySettings(data.settings);
         } catch (error) {
-            console.error('Failed to load users:', error);
+            console.error('Failed to load bootstrap data:', error);
         }
     }
 
@@ -550,18 +501,10 @@ class RemindMineApp {
         }
     }
 
-    async loadSettings() {
-        try {
-            const response = await fetch('/api/web/settings');
-            if (!response.ok) throw new Error('Failed to fetch settings');
-            
-            const settings = await response.json();
-            document.getElementById('auto-advice-toggle').checked = settings.auto_advice_enabled;
-            document.getElementById('issues-per-page-setting').value = settings.issues_per_page;
-            this.issuesPerPage = settings.issues_per_page;
-        } catch (error) {
-            console.error('Failed to load settings:', error);
-        }
+    applySettings(settings) {
+        document.getElementById('auto-advice-toggle').checked = settings.auto_advice_enabled;
+        document.getElementById('issues-per-page-setting').value = settings.issues_per_page;
+        this.issuesPerPage = settings.issues_per_page;
     }
 
     populateSelect(selectId, items, valueField, textField, defaultText = null) {
@@ -600,7 +543,13 @@ class RemindMineApp {
                 throw new Error(error.detail || 'Failed to generate advice');
             }
 
-            this.showNotification('AIアドバイスが生成されました', 'success');
+            // 直前に生成したアドバイス (連打など) はサーバー側で再利用される
+            const data = await response.json();
+            if (data.reused) {
+                this.showNotification('直前に生成したアドバイスが承認待ちです', 'info');
+            } else {
+                this.showNotification('AIアドバイスが生成されました', 'success');
+            }
             this.loadIssues(); // Refresh to show new advice
 
         } catch (error) {
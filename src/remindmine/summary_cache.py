@@ -3,6 +3,7 @@
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional
 from hashlib import md5
@@ -21,6 +22,8 @@ class SummaryCacheService:
         """
         self.cache_file_path = cache_file_path
         self._cache = {}
+        # Summaries may be generated from worker threads (prefetch); guard cache and file writes
+        self._lock = threading.RLock()
         self._load_cache()
     
     def _load_cache(self):
@@ -43,8 +46,9 @@ class SummaryCacheService:
             # Ensure cache directory exists
             os.makedirs(os.path.dirname(self.cache_file_path), exist_ok=True)
             
-            with open(self.cache_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                with open(self.cache_file_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._cache, f, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
     
@@ -137,16 +141,17 @@ class SummaryCacheService:
             cache_key = self._get_cache_key(issue_id)
             content_hash = self._get_issue_hash(issue)
             
-            self._cache[cache_key] = {
-                "issue_id": issue_id,
-                "content_hash": content_hash,
-                "cached_at": datetime.now().isoformat(),
-                "updated_on": issue.get("updated_on"),
-                "summaries": summaries
-            }
-            
-            # Save to file
-            self._save_cache()
+            with self._lock:
+                self._cache[cache_key] = {
+                    "issue_id": issue_id,
+                    "content_hash": content_hash,
+                    "cached_at": datetime.now().isoformat(),
+                    "updated_on": issue.get("updated_on"),
+                    "summaries": summaries
+                }
+                
+                # Save to file
+                self._save_cache()
             logger.debug(f"Cached summary for issue {issue_id}")
             
         except Exception as e:
@@ -160,9 +165,10 @@ class SummaryCacheService:
         """
         try:
             cache_key = self._get_cache_key(issue_id)
-            if cache_key in self._cache:
-                del self._cache[cache_key]
-                self._save_cache()
+            with self._lock:
+                if cache_key in self._cache:
+                    del self._cache[cache_key]
+                    self._save_cache()
                 logger.debug(f"Invalidated cache for issue {issue_id}")
         except Exception as e:
             logger.error(f"Failed to invalidate cache for issue {issue_id}: {e}")
@@ -170,8 +176,9 @@ class SummaryCacheService:
     def clear_cache(self):
         """Clear all cached data."""
         try:
-            self._cache = {}
-            self._save_cache()
+            with self._lock:
+                self._cache = {}
+                self._save_cache()
             logger.info("Cleared all cached summaries")
         except Exception as e:
             logger.error(f"Failed to clear cache: {e}")
@@ -7,14 +7,34 @@
  - SUMMARY_ENFORCE_TRUNCATE のみ継続 (true/false 既定: false)。true の場合はテンプレートの想定(=200)を上限とみなし末尾を ... で切り詰め。
 """
 
+import asyncio
 import logging
 import os
-from typing import Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import orjson
 import requests
 from .summary_cache import SummaryCacheService
 
 logger = logging.getLogger(__name__)
 
+# プロンプトへ渡すコメントの上限 (Ollama の prefill はトークン数にほぼ比例するため)
+NOTE_MAX_CHARS = 500
+MAX_JOURNALS = 20
+
+_QUOTE_LINE_RE = re.compile(r"^\s*>.*$", re.MULTILINE)
+_MARKUP_RE = re.compile(r"</?[a-zA-Z][^>]*>|```|~~~|\*\*|^\s*(?:h[1-6]\.|#{1,6})\s", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _clean_notes(notes: str) -> str:
+    """Strip quoted replies and Textile/Markdown markup from a journal note and cap its length."""
+    notes = _QUOTE_LINE_RE.sub("", notes)
+    notes = _MARKUP_RE.sub(" ", notes)
+    notes = _WHITESPACE_RE.sub(" ", notes).strip()
+    return notes[:NOTE_MAX_CHARS]
+
 
 class SummaryService:
     """Service for generating a unified current-state summary of an issue (content + journals)."""
@@ -34,6 +54,14 @@ class SummaryService:
         else:
             self.cache_service = None
 
+        # Ollama への同時要約生成数。先読みは別枠 (小さめ) にして、ページ表示が先読みの後ろに並ばないようにする
+        self._generation_semaphore = asyncio.Semaphore(4)
+        self._prefetch_semaphore = asyncio.Semaphore(2)
+        # 要約生成専用のスレッド (両方の枠の合計)。既定の executor を使う Redmine 呼び出しと取り合わない
+        self._executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="summary")
+        # 生成中の要約 ((issue_id, updated_on) -> Task)。ページ表示と先読みで同じ Task を待ち、重複生成しない
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
     def _load_template(self, name: str) -> Optional[str]:
         """Load prompt template text by filename (without path)."""
         try:
@@ -44,11 +72,16 @@ class SummaryService:
             logger.error(f"Failed to load prompt template {name}: {e}")
             return None
     
-    def _chat_with_ollama(self, prompt: str) -> Optional[str]:
+    def _chat_with_ollama(self, prompt: str, max_length: Optional[int] = None) -> Optional[str]:
         """Chat with Ollama LLM.
         
+        The response is streamed; when ``max_length`` is given the connection is
+        closed as soon as enough text has been received, so generation of the
+        part that would be truncated anyway is not waited for.
+        
         Args:
             prompt: Prompt to send to LLM
+            max_length: Stop reading once the response exceeds this length (None: read all)
             
         Returns:
             Response from LLM or None if failed
@@ -58,14 +91,28 @@ class SummaryService:
             data = {
                 "model": self.ollama_model,
                 "prompt": prompt,
-                "stream": False
+                "stream": True
             }
             
-            response = requests.post(url, json=data, timeout=60)
-            response.raise_for_status()
-            result = response.json()
+            parts = []
+            length = 0
+            with requests.post(url, json=data, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    text = chunk.get("response", "")
+                    parts.append(text)
+                    length += len(text)
+                    if chunk.get("done"):
+                        break
+                    # 余裕分 (+20) を読んだら打ち切り (以降は切り詰められるため)
+                    if max_length is not None and length >= max_length + 20:
+                        logger.debug(f"Stopped Ollama stream early at {length} chars")
+                        break
             
-            return result.get("response", "").strip()
+            return "".join(parts).strip()
             
         except Exception as e:
             logger.error(f"Failed to chat with Ollama: {e}")
@@ -81,7 +128,7 @@ class SummaryService:
         try:
             subject = issue.get("subject", "").strip()
             description = issue.get("description", "").strip()
-            journals = issue.get("journals", []) or []
+            journals = issue.get("journals") or ()
             prompt_limit = self.PROMPT_LIMIT
 
             if not subject and not description and not journals:
@@ -101,9 +148,13 @@ class SummaryService:
                     continue
                 if "🤖 AI自動アドバイス" in notes:
                     continue
+                notes = _clean_notes(notes)
+                if not notes:
+                    continue
                 user = j.get("user", {}).get("name", "Unknown")
-                created_on = j.get("created_on", "")
                 meaningful.append(f"[{user}] {notes}")
+            # 直近 MAX_JOURNALS 件のみ使用
+            meaningful = meaningful[-MAX_JOURNALS:]
 
             if meaningful:
                 parts.append("[コメント]" + "\n" + "\n".join(meaningful))
@@ -115,7 +166,8 @@ class SummaryService:
                 return None
             prompt = template.replace('{{ISSUE_AND_JOURNALS}}', combined)
 
-            summary = self._chat_with_ollama(prompt)
+            max_length = prompt_limit if self.enforce_truncate else None
+            summary = self._chat_with_ollama(prompt, max_length=max_length)
             if summary:
                 summary = summary.strip()
                 if self.enforce_truncate and prompt_limit and len(summary) > prompt_limit:
@@ -139,25 +191,20 @@ class SummaryService:
         """
         try:
             # Try to get cached summary first
-            if self.cache_service:
-                cached_summary = self.cache_service.get_cached_summary(issue)
-                if cached_summary:
-                    # 旧フォーマット (journal_summary が存在し値あり) は再生成対象
-                    if cached_summary.get("journal_summary"):
-                        logger.debug("Legacy separate summaries detected; regenerating unified summary")
-                    else:
-                        logger.debug(f"Using cached summary for issue {issue.get('id')}")
-                        return cached_summary
+            cached_summary = self._get_cached_summary_data(issue)
+            if cached_summary:
+                return cached_summary
             
             # Generate new summaries
             logger.debug(f"Generating new summary for issue {issue.get('id')}")
             unified = self.summarize_issue_current_state(issue)
+            journals = issue.get("journals") or ()
             summary_data = {
                 # 新仕様: content_summary に統合サマリを格納。journal_summary は互換のため残すが None。
                 "content_summary": unified,
                 "journal_summary": None,
-                "has_journals": bool(issue.get("journals")),
-                "journal_count": len(issue.get("journals", []))
+                "has_journals": bool(journals),
+                "journal_count": len(journals)
             }
             
             # Cache the new summaries
@@ -175,6 +222,78 @@ class SummaryService:
                 "journal_count": 0
             }
     
+    def _get_cached_summary_data(self, issue: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached unified summary for an unchanged issue, or None."""
+        if not self.cache_service:
+            return None
+        cached_summary = self.cache_service.get_cached_summary(issue)
+        if not cached_summary:
+            return None
+        # 旧フォーマット (journal_summary が存在し値あり) は再生成対象
+        if cached_summary.get("journal_summary"):
+            logger.debug("Legacy separate summaries detected; regenerating unified summary")
+            return None
+        logger.debug(f"Using cached summary for issue {issue.get('id')}")
+        return cached_summary
+    
+    async def _run_generation(self, issue: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Run get_issue_summary_data on the summary executor; releases the caller's slot when done."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self.get_issue_summary_data, issue)
+        finally:
+            semaphore.release()
+    
+    async def _get_summary_data_limited(self, issue: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Return summary data, generating it under ``semaphore`` unless cached or already in flight."""
+        cached_summary = self._get_cached_summary_data(issue)
+        if cached_summary:
+            return cached_summary
+
+        issue_id = issue.get("id")
+        key = (issue_id, issue.get("updated_on")) if issue_id is not None else None
+        task = self._inflight.get(key)
+        if task is None:
+            await semaphore.acquire()
+            # 枠を待つ間に他の経路が生成を始めた / 終えたかもしれない
+            cached_summary = self._get_cached_summary_data(issue)
+            task = self._inflight.get(key)
+            if cached_summary or task is not None:
+                semaphore.release()
+                if cached_summary:
+                    return cached_summary
+            else:
+                task = asyncio.create_task(self._run_generation(issue, semaphore))
+                if key is not None:
+                    self._inflight[key] = task
+                    task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 待機側のキャンセルで共有 Task を止めない
+        return await asyncio.shield(task)
+    
+    async def get_issue_summary_data_async(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of get_issue_summary_data (runs in a worker thread).
+
+        Cache hits return without a thread. At most 4 summaries are generated
+        at a time for page requests; prefetch has its own smaller limit, so
+        page requests never queue behind it. Concurrent calls for the same
+        issue revision await one shared task instead of generating twice.
+        """
+        return await self._get_summary_data_limited(issue, self._generation_semaphore)
+
+    async def prefetch_batch(self, issues: List[Dict[str, Any]]):
+        """Warm the summary cache for the given issues in the background.
+
+        Summaries already being generated (by a page request or an earlier
+        prefetch) are awaited rather than started again; at most 2 prefetch
+        summaries are generated at a time, outside the page request limit.
+        """
+        async def _prefetch(issue: Dict[str, Any]):
+            try:
+                await self._get_summary_data_limited(issue, self._prefetch_semaphore)
+            except Exception as e:
+                logger.error(f"Failed to prefetch summary for issue {issue.get('id')}: {e}")
+
+        await asyncio.gather(*(_prefetch(issue) for issue in issues))
+
     def clear_cache(self):
         """Clear all cached summaries."""
         if self.cache_service:
@@ -1,23 +1,66 @@
 """Web API routes for RemindMine dashboard."""
 
+import asyncio
 import logging
 import os
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+import jinja2
 from fastapi import APIRouter, HTTPException, Request, Form, Depends
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
+from .ai_providers import get_ai_provider
+from .chromadb_admin import ChromaDBAdminService
+from .config import config
 from .redmine_client import RedmineClient
 from .rag_service import RAGService
 from .summary_service import SummaryService
 from .web_config import web_config
-from .pending_advice import pending_advice_manager
+from .pending_advice import PendingAdvice, pending_advice_manager
 
 logger = logging.getLogger(__name__)
 
-# Initialize templates
-templates = Jinja2Templates(directory="src/remindmine/templates")
+# Data files kept next to the ChromaDB directory
+_DATA_DIR = os.path.dirname(config.chromadb_path)
+_CACHE_FILE_PATH = os.path.join(_DATA_DIR, "summary_cache.json")
+_RAG_STATE_PATH = os.path.join(_DATA_DIR, "rag_index_state.json")
+
+# Initialize templates (resolved from the package, not the working directory)
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+_TEMPLATE_CACHE_DIR = os.path.join(_DATA_DIR, "jinja_cache")
+
+templates = Jinja2Templates(env=jinja2.Environment(
+    loader=jinja2.FileSystemLoader(_TEMPLATES_DIR),
+    autoescape=True,
+    # 本番ではテンプレートの更新チェック (stat) を行わない
+    auto_reload=config.debug,
+    cache_size=400,
+))
+
+
+def _enable_template_bytecode_cache():
+    """Store compiled templates under the data directory so restarts skip re-parsing.
+
+    The directory is created at startup; if it cannot be created or written,
+    templates are simply compiled in memory.
+    """
+    try:
+        os.makedirs(_TEMPLATE_CACHE_DIR, exist_ok=True)
+        if not os.access(_TEMPLATE_CACHE_DIR, os.W_OK):
+            raise PermissionError(f"{_TEMPLATE_CACHE_DIR} is not writable")
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled: {e}")
+        return
+    templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache(_TEMPLATE_CACHE_DIR)
+
+# Repeated advice requests for unchanged issue content within this window reuse the pending advice
+_ADVICE_DEDUPE_SECONDS = 30
+
+# AI advice comment: header line with the marker, one separator line, then the body
+_ADVICE_RE = re.compile(r"🤖 AI自動アドバイス[^\n]*\n[^\n]*\n(.*)", re.DOTALL)
 
 # Router for web endpoints
 web_router = APIRouter()
@@ -25,6 +68,12 @@ web_router = APIRouter()
 # Dependency functions (will be set up by main app)
 _rag_service = None
 _redmine_client = None
+# Shared summary service: a single instance keeps one in-memory cache so
+# background prefetch and request handlers stay coherent.
+_summary_service = None
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: set = set()
 
 
 def get_rag_service():
@@ -37,12 +86,35 @@ def get_redmine_client():
     return _redmine_client
 
 
+def get_summary_service():
+    """Get summary service instance."""
+    return _summary_service
+
+
 def set_dependencies(rag_service: RAGService, redmine_client: RedmineClient):
-    """Set dependency instances."""
-    global _rag_service, _redmine_client
+    """Set dependency instances.
+
+    The summary service is created here once, with the same Ollama config as
+    rag_service, so its cache file is loaded once per process. Outside debug mode
+    the template bytecode cache is enabled and the dashboard templates are
+    compiled here as well.
+    """
+    global _rag_service, _redmine_client, _summary_service
     _rag_service = rag_service
     _redmine_client = redmine_client
 
+    _summary_service = SummaryService(
+        ollama_base_url=rag_service.ollama_base_url,
+        ollama_model=rag_service.ollama_model,
+        cache_file_path=_CACHE_FILE_PATH
+    )
+
+    if not config.debug:
+        _enable_template_bytecode_cache()
+        # 起動時にコンパイルしておき、最初のリクエストで待たせない
+        for template_name in ("index.html", "chromadb_admin.html"):
+            templates.env.get_template(template_name)
+
 
 # IssueCreateRequest は Issue 作成機能廃止に伴い削除
 
@@ -57,6 +129,11 @@ class AutoAdviceSettingsRequest(BaseModel):
     enabled: bool
 
 
+class AdviceBatchRequest(BaseModel):
+    """Request model for batch advice generation."""
+    issue_ids: List[int]
+
+
 class AIProviderSettingsRequest(BaseModel):
     """Request model for AI provider settings."""
     ai_provider: str
@@ -71,8 +148,6 @@ async def dashboard(request: Request):
     """Serve the main dashboard page."""
     try:
         # Get system info for template
-        from .config import config
-        
         return templates.TemplateResponse("index.html", {
             "request": request,
             "web_config": web_config,
@@ -85,7 +160,7 @@ async def dashboard(request: Request):
         raise HTTPException(status_code=500, detail="Failed to load dashboard")
 
 
-@web_router.get("/api/web/issues")
+@web_router.get("/api/web/issues", response_class=ORJSONResponse)
 async def get_issues(
     page: int = 1,
     limit: int = 20,
@@ -93,7 +168,7 @@ async def get_issues(
     status: Optional[str] = None,
     priority: Optional[str] = None,
     redmine_client: RedmineClient = Depends(get_redmine_client),
-    rag_service: RAGService = Depends(get_rag_service)
+    summary_service: SummaryService = Depends(get_summary_service)
 ):
     """Get paginated issues with filters."""
     try:
@@ -124,11 +199,13 @@ async def get_issues(
         if status:
             status_id_str = status
             
-        issues = redmine_client.get_issues(
+        issues, total_issues = await asyncio.to_thread(
+            redmine_client.get_issues_with_total,
             project_id=project_id_int,
             status_id=status_id_str,
             limit=limit,
-            offset=offset
+            offset=offset,
+            include='journals'
         )
         
         # Apply priority filter on client side if needed
@@ -139,17 +216,34 @@ async def get_issues(
             except (ValueError, KeyError):
                 pass  # Skip invalid priority filtering
         
-        # Enhance issues with AI advice
-        enhanced_issues = []
-        for issue in issues:
-            enhanced_issue = _enhance_issue_data(issue, rag_service)
-            enhanced_issues.append(enhanced_issue)
-        
-        # Get total count (approximation)
-        total_issues = getattr(redmine_client, 'last_total_count', len(issues))
-        total_pages = max(1, (total_issues + limit - 1) // limit)
-        
-        return {
+        # Enhance issues with AI advice and summaries (summaries generated concurrently)
+        results = await asyncio.gather(
+            *[_enhance_issue_data_async(issue, summary_service) for issue in issues],
+            return_exceptions=True
+        )
+        enhanced_issues = [
+            _enhanced_or_fallback(issue, result)
+            for issue, result in zip(issues, results)
+        ]
+        
+        # Total count comes with the page (ceil division; at least one page)
+        total_pages = -(-total_issues // limit) or 1
+        
+        # Warm the summary cache for the next page while the user reads this one
+        if summary_service and page < total_pages:
+            task = asyncio.create_task(_prefetch_issue_summaries(
+                redmine_client,
+                summary_service,
+                project_id=project_id_int,
+                status_id=status_id_str,
+                limit=limit,
+                offset=offset + limit
+            ))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+        
+        # 返却値は JSON 互換の dict のみなので jsonable_encoder を通さず orjson で直接シリアライズ
+        return ORJSONResponse({
             "issues": enhanced_issues,
             "pagination": {
                 "current_page": page,
@@ -157,55 +251,126 @@ async def get_issues(
                 "total_issues": total_issues,
                 "per_page": limit
             }
-        }
+        })
         
     except Exception as e:
         logger.error(f"Failed to get issues: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch issues")
 
 
+async def _prefetch_issue_summaries(
+    redmine_client: RedmineClient,
+    summary_service: SummaryService,
+    **issue_filters: Any
+):
+    """Fetch a page of issues and pre-generate their summaries (background task)."""
+    try:
+        issues = await asyncio.to_thread(redmine_client.get_issues, include='journals', **issue_filters)
+        await summary_service.prefetch_batch(issues)
+    except Exception as e:
+        logger.error(f"Failed to prefetch issue summaries: {e}")
+
+
 # POST /api/web/issues は廃止
 
 
 @web_router.post("/api/web/issues/{issue_id}/advice")
 async def generate_issue_advice(
     issue_id: int,
+    force: bool = False,
     redmine_client: RedmineClient = Depends(get_redmine_client),
     rag_service: RAGService = Depends(get_rag_service)
 ):
-    """Generate AI advice for a specific issue."""
+    """Generate AI advice for a specific issue.
+    
+    A repeated request (e.g. a double click) for unchanged issue content within
+    ``_ADVICE_DEDUPE_SECONDS`` returns the pending advice instead of calling the
+    LLM again; ``force=true`` always generates new advice.
+    """
     try:
         if not redmine_client or not rag_service:
             raise HTTPException(status_code=503, detail="Services not initialized")
         
         # Get issue details
-        issue = redmine_client.get_issue(issue_id)
+        issue = await asyncio.to_thread(redmine_client.get_issue, issue_id)
         if not issue:
             raise HTTPException(status_code=404, detail="Issue not found")
         
-        # Generate advice
-        advice = rag_service.generate_advice_for_issue(issue)
-        
-        if advice:
-            # Add to pending advice instead of posting directly
-            advice_id = pending_advice_manager.add_pending_advice(issue, advice)
-            
-            return {
-                "advice": advice,
-                "advice_id": advice_id,
-                "message": "Advice generated and added to pending list"
-            }
-        else:
-            return {
-                "advice": None,
-                "message": "No advice could be generated"
-            }
+        return await asyncio.to_thread(_generate_pending_advice, issue, rag_service, force)
             
     except Exception as e:
         logger.error(f"Failed to generate advice for issue {issue_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate advice: {str(e)}")
 
 
+@web_router.post("/api/web/issues/advice")
+async def generate_issues_advice(
+    request: AdviceBatchRequest,
+    redmine_client: RedmineClient = Depends(get_redmine_client),
+    rag_service: RAGService = Depends(get_rag_service)
+):
+    """Generate AI advice for several issues, fetching them with one Redmine list request."""
+    try:
+        if not redmine_client or not rag_service:
+            raise HTTPException(status_code=503, detail="Services not initialized")
+        
+        issues = await asyncio.to_thread(redmine_client.get_issues_by_ids, request.issue_ids)
+        found_ids = {issue['id'] for issue in issues}
+        
+        results = []
+        for issue in issues:
+            result = await asyncio.to_thread(_generate_pending_advice, issue, rag_service)
+            result["issue_id"] = issue['id']
+            results.append(result)
+        
+        return {
+            "results": results,
+            "not_found": [issue_id for issue_id in request.issue_ids if issue_id not in found_ids]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to generate advice for issues {request.issue_ids}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate advice: {str(e)}")
+
+
+def _generate_pending_advice(issue: Dict[str, Any], rag_service: RAGService, force: bool = False) -> Dict[str, Any]:
+    """Generate advice for an issue and add it to the pending list.
+    
+    Unless ``force`` is set, advice pending for unchanged issue content that was
+    created within ``_ADVICE_DEDUPE_SECONDS`` is returned as is.
+    """
+    # 連打対策: 内容が変わっていない課題のアドバイスを直前に生成済みなら、LLM を呼ばずにそれを返す
+    existing = None if force else pending_advice_manager.get_pending_by_issue_id(issue['id'])
+    if (existing
+            and existing.content_key == PendingAdvice.content_key_for(issue)
+            and existing.age_seconds() < _ADVICE_DEDUPE_SECONDS):
+        return {
+            "advice": existing.advice_content,
+            "advice_id": existing.id,
+            "reused": True,
+            "message": "Advice for this issue content was just generated and is pending"
+        }
+    
+    advice = rag_service.generate_advice_for_issue(issue)
+    
+    if advice:
+        # Add to pending advice instead of posting directly
+        advice_id = pending_advice_manager.add_pending_advice(issue, advice)
+        
+        return {
+            "advice": advice,
+            "advice_id": advice_id,
+            "message": "Advice generated and added to pending list"
+        }
+    else:
+        return {
+            "advice": None,
+            "message": "No advice could be generated"
+        }
+
+
 @web_router.get("/api/web/projects")
 async def get_projects(redmine_client: RedmineClient = Depends(get_redmine_client)):
     """Get all projects from Redmine."""
@@ -213,7 +378,7 @@ async def get_projects(redmine_client: RedmineClient = Depends(get_redmine_clien
         if not redmine_client:
             raise HTTPException(status_code=503, detail="Redmine client not initialized")
         
-        projects = redmine_client.get_projects()
+        projects = await asyncio.to_thread(redmine_client.get_projects)
         return projects
         
     except Exception as e:
@@ -228,7 +393,7 @@ async def get_trackers(redmine_client: RedmineClient = Depends(get_redmine_clien
         if not redmine_client:
             raise HTTPException(status_code=503, detail="Redmine client not initialized")
         
-        trackers = redmine_client.get_trackers()
+        trackers = await asyncio.to_thread(redmine_client.get_trackers)
         return trackers
         
     except Exception as e:
@@ -243,7 +408,7 @@ async def get_priorities(redmine_client: RedmineClient = Depends(get_redmine_cli
         if not redmine_client:
             raise HTTPException(status_code=503, detail="Redmine client not initialized")
         
-        priorities = redmine_client.get_priorities()
+        priorities = await asyncio.to_thread(redmine_client.get_priorities)
         return priorities
         
     except Exception as e:
@@ -258,7 +423,7 @@ async def get_users(redmine_client: RedmineClient = Depends(get_redmine_client))
         if not redmine_client:
             raise HTTPException(status_code=503, detail="Redmine client not initialized")
         
-        users = redmine_client.get_users()
+        users = await asyncio.to_thread(redmine_client.get_users)
         return users
         
     except Exception as e:
@@ -270,16 +435,50 @@ async def get_users(redmine_client: RedmineClient = Depends(get_redmine_client))
 async def get_settings():
     """Get current web UI settings."""
     try:
-        return {
-            "auto_advice_enabled": web_config.auto_advice_enabled,
-            "issues_per_page": web_config.issues_per_page,
-            "max_advice_length": web_config.max_advice_length
-        }
+        return _web_settings()
     except Exception as e:
         logger.error(f"Failed to get settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to get settings")
 
 
+def _web_settings() -> Dict[str, Any]:
+    """Current web UI settings as returned by the settings API."""
+    return {
+        "auto_advice_enabled": web_config.auto_advice_enabled,
+        "issues_per_page": web_config.issues_per_page,
+        "max_advice_length": web_config.max_advice_length
+    }
+
+
+@web_router.get("/api/web/bootstrap")
+async def get_bootstrap(redmine_client: RedmineClient = Depends(get_redmine_client)):
+    """Get everything the dashboard needs on first load in one response.
+    
+    The Redmine lookups run concurrently; a failed lookup is returned as an
+    empty list so the rest of the dashboard still loads.
+    """
+    if not redmine_client:
+        raise HTTPException(status_code=503, detail="Redmine client not initialized")
+    
+    names = ("projects", "trackers", "priorities", "statuses", "users")
+    results = await asyncio.gather(
+        asyncio.to_thread(redmine_client.get_projects),
+        asyncio.to_thread(redmine_client.get_trackers),
+        asyncio.to_thread(redmine_client.get_priorities),
+        asyncio.to_thread(redmine_client.get_statuses),
+        asyncio.to_thread(redmine_client.get_users),
+        return_exceptions=True
+    )
+    
+    payload: Dict[str, Any] = {"settings": _web_settings()}
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to get {name}: {result}")
+            result = []
+        payload[name] = result
+    return payload
+
+
 @web_router.get("/api/web/statuses")
 async def get_statuses(redmine_client: RedmineClient = Depends(get_redmine_client)):
     """Get all issue statuses from Redmine."""
@@ -287,7 +486,7 @@ async def get_statuses(redmine_client: RedmineClient = Depends(get_redmine_clien
         if not redmine_client:
             raise HTTPException(status_code=503, detail="Redmine client not initialized")
         
-        statuses = redmine_client.get_statuses()
+        statuses = await asyncio.to_thread(redmine_client.get_statuses)
         return statuses
         
     except Exception as e:
@@ -326,20 +525,25 @@ async def update_auto_advice_settings(settings: AutoAdviceSettingsRequest):
 
 
 @web_router.get("/api/web/pending-advice")
-async def get_pending_advice():
-    """Get all pending AI advice."""
+async def get_pending_advice(request: Request, response: Response):
+    """Get all pending AI advice.
+    
+    Supports conditional GETs: pollers that send back the ETag get 304 until the list changes.
+    """
     try:
-        from .pending_advice import pending_advice_manager
-        from .config import config
+        etag = f'W/"{pending_advice_manager.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         
         pending_list = pending_advice_manager.get_all_pending()
         
         # Enhance with Redmine URL
-        enhanced_list = []
-        for pending in pending_list:
-            enhanced = pending.to_dict()
-            enhanced['issue_url'] = f"{config.redmine_url}/issues/{pending.issue_id}"
-            enhanced_list.append(enhanced)
+        issue_url_base = config.redmine_url.rstrip('/') + '/issues/'
+        enhanced_list = [
+            {**pending.to_dict(), 'issue_url': issue_url_base + str(pending.issue_id)}
+            for pending in pending_list
+        ]
         
         return {
             "pending_advice": enhanced_list,
@@ -352,12 +556,12 @@ async def get_pending_advice():
 
 
 @web_router.post("/api/web/pending-advice/{advice_id}/approve")
-async def approve_pending_advice(advice_id: str):
+async def approve_pending_advice(
+    advice_id: str,
+    redmine_client: RedmineClient = Depends(get_redmine_client)
+):
     """Approve and post pending AI advice to Redmine."""
     try:
-        from .pending_advice import pending_advice_manager
-        from .app import redmine_client
-        
         if not redmine_client:
             raise HTTPException(status_code=503, detail="Redmine client not initialized")
         
@@ -367,7 +571,7 @@ async def approve_pending_advice(advice_id: str):
             raise HTTPException(status_code=404, detail="Pending advice not found")
         
         # Post to Redmine
-        success = redmine_client.add_comment(pending.issue_id, pending.advice_content)
+        success = await asyncio.to_thread(redmine_client.add_comment, pending.issue_id, pending.advice_content)
         
         if success:
             # Remove from pending list
@@ -391,8 +595,6 @@ async def approve_pending_advice(advice_id: str):
 async def reject_pending_advice(advice_id: str):
     """Reject and remove pending AI advice."""
     try:
-        from .pending_advice import pending_advice_manager
-        
         # Get pending advice
         pending = pending_advice_manager.get_pending_by_id(advice_id)
         if not pending:
@@ -417,8 +619,6 @@ async def reject_pending_advice(advice_id: str):
 async def clear_all_pending_advice():
     """Clear all pending AI advice."""
     try:
-        from .pending_advice import pending_advice_manager
-        
         count = pending_advice_manager.clear_all_pending()
         
         return {
@@ -431,22 +631,60 @@ async def clear_all_pending_advice():
         raise HTTPException(status_code=500, detail="Failed to clear pending advice")
 
 
-def _enhance_issue_data(issue: Dict[str, Any], rag_service: Optional[RAGService]) -> Dict[str, Any]:
-    """Enhance issue data with additional information for web display."""
-    from .config import config
+class _IssueKey:
+    """Hashable wrapper identifying an issue revision by ``(id, updated_on)`` for lru_cache."""
+    
+    __slots__ = ("issue", "key")
+    
+    def __init__(self, issue: Dict[str, Any]):
+        self.issue = issue
+        self.key = (issue.get("id"), issue.get("updated_on"))
+    
+    def __hash__(self):
+        return hash(self.key)
     
+    def __eq__(self, other):
+        return isinstance(other, _IssueKey) and self.key == other.key
+
+
+@lru_cache(maxsize=4096)
+def _issue_display_fields_cached(issue_key: _IssueKey) -> Dict[str, Any]:
+    """Memoized _build_issue_display_fields; unchanged issues are not re-scanned."""
+    fields = _build_issue_display_fields(issue_key.issue)
+    # キャッシュのキーとして保持されるため、元の issue 辞書への参照は手放す
+    issue_key.issue = None
+    return fields
+
+
+def _issue_display_fields(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Get display fields for an issue, cached per ``(id, updated_on)``."""
+    if issue.get("id") is None or issue.get("updated_on") is None:
+        return _build_issue_display_fields(issue)
+    # 呼び出し側が update() するためコピーを返す
+    return dict(_issue_display_fields_cached(_IssueKey(issue)))
+
+
+def _name_of(ref: Optional[Dict[str, Any]], default: Optional[str]) -> Optional[str]:
+    """Return ``ref["name"]`` of a Redmine reference (status, project, ...), or ``default``."""
+    return ref.get("name", default) if ref else default
+
+
+def _build_issue_display_fields(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the display fields of an issue (without summaries)."""
+    get = issue.get
+    issue_id = get("id")
     enhanced = {
-        "id": issue.get("id"),
-        "subject": issue.get("subject", ""),
-        "description": issue.get("description", ""),
-        "status": issue.get("status", {}).get("name", "Unknown"),
-        "priority": issue.get("priority", {}).get("name", "Normal"),
-        "project": issue.get("project", {}).get("name", "Unknown"),
-        "tracker": issue.get("tracker", {}).get("name", "Unknown"),
-        "assigned_to": issue.get("assigned_to", {}).get("name") if issue.get("assigned_to") else None,
-        "created_on": issue.get("created_on"),
-        "updated_on": issue.get("updated_on"),
-        "redmine_url": f"{config.redmine_url}/issues/{issue.get('id')}",
+        "id": issue_id,
+        "subject": get("subject", ""),
+        "description": get("description", ""),
+        "status": _name_of(get("status"), "Unknown"),
+        "priority": _name_of(get("priority"), "Normal"),
+        "project": _name_of(get("project"), "Unknown"),
+        "tracker": _name_of(get("tracker"), "Unknown"),
+        "assigned_to": _name_of(get("assigned_to"), None),
+        "created_on": get("created_on"),
+        "updated_on": get("updated_on"),
+        "redmine_url": f"{config.redmine_url}/issues/{issue_id}",
         "ai_advice": None,
     # 新仕様: content_summary に本文+コメント統合サマリを格納。journal_summary は後方互換用に残すが常に None。
     "content_summary": None,
@@ -461,31 +699,36 @@ def _enhance_issue_data(issue: Dict[str, Any], rag_service: Optional[RAGService]
         enhanced["journal_count"] = len(issue["journals"])
         
         for journal in issue["journals"]:
-            notes = journal.get("notes", "")
-            if "🤖 AI自動アドバイス" in notes:
-                # Extract advice content (remove the header)
-                advice_lines = notes.split("\n")
-                if len(advice_lines) > 1:
-                    enhanced["ai_advice"] = "\n".join(advice_lines[2:]).strip()
+            # Extract advice content (remove the two header lines)
+            m = _ADVICE_RE.search(journal.get("notes") or "")
+            if m:
+                enhanced["ai_advice"] = m.group(1).strip()
                 break
     
-    # Generate summaries if we have rag_service (contains ollama config)
-    if rag_service:
+    return enhanced
+
+
+def _enhance_issue_data(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Enhance issue data with display fields only (no summaries)."""
+    return _issue_display_fields(issue)
+
+
+def _enhanced_or_fallback(issue: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    """Return a gathered enhancement result, or the display fields alone if it failed."""
+    if isinstance(result, BaseException):
+        logger.error(f"Failed to enhance issue {issue.get('id', 'unknown')}: {result}")
+        return _enhance_issue_data(issue)
+    return result
+
+
+async def _enhance_issue_data_async(issue: Dict[str, Any], summary_service: Optional[SummaryService]) -> Dict[str, Any]:
+    """Enhance issue data with additional information for web display, including summaries."""
+    enhanced = _enhance_issue_data(issue)
+    
+    if summary_service:
         try:
-            # Initialize summary service with same ollama config as rag_service and cache
-            from .config import config
-            # Use the same data directory as chromadb for cache
-            data_dir = os.path.dirname(config.chromadb_path)
-            cache_file_path = os.path.join(data_dir, "summary_cache.json")
-            
-            summary_service = SummaryService(
-                ollama_base_url=rag_service.ollama_base_url,
-                ollama_model=rag_service.ollama_model,
-                cache_file_path=cache_file_path
-            )
-            
             # Get all summary data (uses cache if available)
-            summary_data = summary_service.get_issue_summary_data(issue)
+            summary_data = await summary_service.get_issue_summary_data_async(issue)
             enhanced.update(summary_data)
             
         except Exception as e:
@@ -495,33 +738,23 @@ def _enhance_issue_data(issue: Dict[str, Any], rag_service: Optional[RAGService]
 
 
 @web_router.post("/api/web/issues/{issue_id}/summaries/regenerate")
-async def regenerate_issue_summaries(issue_id: int, rag_service: RAGService = Depends(get_rag_service), redmine_client: RedmineClient = Depends(get_redmine_client)):
+async def regenerate_issue_summaries(issue_id: int, summary_service: SummaryService = Depends(get_summary_service), redmine_client: RedmineClient = Depends(get_redmine_client)):
     """Force invalidate and regenerate summaries for a specific issue.
 
     Frontend からの明示操作用。キャッシュを無効化し最新内容で再計算した結果を返す。
     """
     try:
-        if not rag_service or not redmine_client:
+        if not summary_service or not redmine_client:
             raise HTTPException(status_code=503, detail="Services not initialized")
 
         # Issue 詳細取得
-        issue = redmine_client.get_issue(issue_id)
+        issue = await asyncio.to_thread(redmine_client.get_issue, issue_id)
         if not issue:
             raise HTTPException(status_code=404, detail="Issue not found")
 
-        from .config import config
-        data_dir = os.path.dirname(config.chromadb_path)
-        cache_file_path = os.path.join(data_dir, "summary_cache.json")
-
-        summary_service = SummaryService(
-            ollama_base_url=rag_service.ollama_base_url,
-            ollama_model=rag_service.ollama_model,
-            cache_file_path=cache_file_path
-        )
-
         # キャッシュ無効化 -> 再生成
         summary_service.invalidate_issue_cache(issue_id)
-        summary_data = summary_service.get_issue_summary_data(issue)
+        summary_data = await summary_service.get_issue_summary_data_async(issue)
 
         return {"issue_id": issue_id, "summaries": summary_data, "message": "サマリを再生成しました"}
     except HTTPException:
@@ -532,21 +765,11 @@ async def regenerate_issue_summaries(issue_id: int, rag_service: RAGService = De
 
 
 @web_router.get("/api/web/cache/stats")
-async def get_cache_stats(rag_service: RAGService = Depends(get_rag_service)):
+async def get_cache_stats(summary_service: SummaryService = Depends(get_summary_service)):
     """Get summary cache statistics."""
     try:
-        if not rag_service:
-            return {"error": "RAG service not available"}
-        
-        from .config import config
-        data_dir = os.path.dirname(config.chromadb_path)
-        cache_file_path = os.path.join(data_dir, "summary_cache.json")
-        
-        summary_service = SummaryService(
-            ollama_base_url=rag_service.ollama_base_url,
-            ollama_model=rag_service.ollama_model,
-            cache_file_path=cache_file_path
-        )
+        if not summary_service:
+            return {"error": "Summary service not available"}
         
         stats = summary_service.get_cache_stats()
         return {"success": True, "stats": stats}
@@ -560,8 +783,6 @@ async def get_cache_stats(rag_service: RAGService = Depends(get_rag_service)):
 async def get_ai_provider_config():
     """Get current AI provider configuration."""
     try:
-        from .config import config
-        
         # 利用可能なモデル一覧
         available_models = {
             "ollama": [
@@ -630,23 +851,22 @@ async def update_ai_provider_config(request: AIProviderSettingsRequest):
 
 
 @web_router.get("/api/web/ai-provider/test")
-async def test_ai_provider(provider: Optional[str] = None):
+async def test_ai_provider(response: Response, provider: Optional[str] = None):
     """Test AI provider connection."""
     try:
-        from .config import config
-        from .ai_providers import create_ai_provider
-        
         test_provider = provider or config.ai_provider
         
         # プロバイダのテスト
-        ai_provider = create_ai_provider(test_provider, config)
+        ai_provider = get_ai_provider(test_provider, config)
         
         # 簡単なテストクエリ
         test_query = "テスト"
-        embedding = ai_provider.embed_query(test_query)
+        embedding = await asyncio.to_thread(ai_provider.embed_query, test_query)
         
         if embedding and len(embedding) > 0:
-            completion = ai_provider.generate_completion("こんにちはと挨拶してください。")
+            completion = await asyncio.to_thread(ai_provider.generate_completion, "こんにちはと挨拶してください。")
+            # 接続テストは重いので、成功結果はブラウザ側で短時間再利用させる
+            response.headers["Cache-Control"] = "max-age=30"
             return {
                 "success": True,
                 "provider": test_provider,
@@ -670,23 +890,20 @@ async def test_ai_provider(provider: Optional[str] = None):
 
 
 @web_router.post("/api/web/cache/clear")
-async def clear_cache(rag_service: RAGService = Depends(get_rag_service)):
-    """Clear all cached summaries."""
+async def clear_cache(
+    summary_service: SummaryService = Depends(get_summary_service),
+    redmine_client: RedmineClient = Depends(get_redmine_client)
+):
+    """Clear all cached summaries and the cached Redmine reference data."""
     try:
-        if not rag_service:
-            return {"error": "RAG service not available"}
-        
-        from .config import config
-        data_dir = os.path.dirname(config.chromadb_path)
-        cache_file_path = os.path.join(data_dir, "summary_cache.json")
-        
-        summary_service = SummaryService(
-            ollama_base_url=rag_service.ollama_base_url,
-            ollama_model=rag_service.ollama_model,
-            cache_file_path=cache_file_path
-        )
+        if not summary_service:
+            return {"error": "Summary service not available"}
         
         summary_service.clear_cache()
+        _issue_display_fields_cached.cache_clear()
+        # プロジェクト・トラッカー・ユーザー等も次回 Redmine から取り直す
+        if redmine_client:
+            redmine_client.clear_reference_cache()
         return {"success": True, "message": "キャッシュをクリアしました"}
         
     except Exception as e:
@@ -695,21 +912,11 @@ async def clear_cache(rag_service: RAGService = Depends(get_rag_service)):
 
 
 @web_router.post("/api/web/cache/invalidate/{issue_id}")
-async def invalidate_issue_cache(issue_id: int, rag_service: RAGService = Depends(get_rag_service)):
+async def invalidate_issue_cache(issue_id: int, summary_service: SummaryService = Depends(get_summary_service)):
     """Invalidate cache for a specific issue."""
     try:
-        if not rag_service:
-            return {"error": "RAG service not available"}
-        
-        from .config import config
-        data_dir = os.path.dirname(config.chromadb_path)
-        cache_file_path = os.path.join(data_dir, "summary_cache.json")
-        
-        summary_service = SummaryService(
-            ollama_base_url=rag_service.ollama_base_url,
-            ollama_model=rag_service.ollama_model,
-            cache_file_path=cache_file_path
-        )
+        if not summary_service:
+            return {"error": "Summary service not available"}
         
         summary_service.invalidate_issue_cache(issue_id)
         return {"success": True, "message": f"Issue {issue_id} のキャッシュを無効化しました"}
@@ -726,9 +933,12 @@ async def reindex_rag(rag_service: RAGService = Depends(get_rag_service), redmin
         if not rag_service or not redmine_client:
             raise HTTPException(status_code=503, detail="Services not initialized")
 
-        issues = redmine_client.get_all_issues_with_journals()
-        chunk_count = rag_service.index_issues(issues)
-        return {"success": True, "issues_indexed": len(issues), "chunks_indexed": chunk_count}
+        # 全件をメモリに載せず、取得したバッチから順にインデックスする
+        issues_indexed, chunk_count = await asyncio.to_thread(
+            rag_service.index_issue_batches,
+            redmine_client.iter_issues_with_journals()
+        )
+        return {"success": True, "issues_indexed": issues_indexed, "chunks_indexed": chunk_count}
     except HTTPException:
         raise
     except Exception as e:
@@ -742,8 +952,6 @@ async def reindex_rag(rag_service: RAGService = Depends(get_rag_service), redmin
 async def chromadb_admin_page(request: Request):
     """ChromaDB管理画面を表示。"""
     try:
-        from .config import config
-        
         return templates.TemplateResponse("chromadb_admin.html", {
             "request": request,
             "chromadb_path": config.chromadb_path
@@ -757,9 +965,6 @@ async def chromadb_admin_page(request: Request):
 async def get_chromadb_collections():
     """ChromaDBのコレクション一覧を取得。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         collections = admin_service.get_collections()
         
@@ -780,9 +985,6 @@ async def get_chromadb_collection_documents(
 ):
     """指定されたコレクションのドキュメント一覧を取得。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         result = admin_service.get_collection_documents(collection_name, limit, offset)
         
@@ -796,9 +998,6 @@ async def get_chromadb_collection_documents(
 async def get_chromadb_document_detail(collection_name: str, document_id: str):
     """指定されたドキュメントの詳細情報を取得。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         document = admin_service.get_document_detail(collection_name, document_id)
         
@@ -821,9 +1020,6 @@ async def search_chromadb_documents(
 ):
     """指定されたコレクション内でドキュメントを検索。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         result = admin_service.search_documents(collection_name, query, n_results)
         
@@ -837,9 +1033,6 @@ async def search_chromadb_documents(
 async def get_chromadb_collection_stats(collection_name: str):
     """指定されたコレクションの統計情報を取得。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         stats = admin_service.get_collection_stats(collection_name)
         
@@ -853,9 +1046,6 @@ async def get_chromadb_collection_stats(collection_name: str):
 async def delete_chromadb_document(collection_name: str, document_id: str):
     """指定されたドキュメントを削除。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         success = admin_service.delete_document(collection_name, document_id)
         
@@ -874,9 +1064,6 @@ async def delete_chromadb_document(collection_name: str, document_id: str):
 async def delete_chromadb_collection(collection_name: str):
     """指定されたコレクションを削除。"""
     try:
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         success = admin_service.delete_collection(collection_name)
         
@@ -900,15 +1087,12 @@ async def force_reindex_collection(
     """コレクションの強制再インデックス"""
     try:
         # 全課題を取得
-        issues = redmine_client.get_issues()
+        issues = await asyncio.to_thread(redmine_client.get_issues)
         
         # 強制再インデックス実行
-        chunks_added = rag_service.index_issues(issues, full_rebuild=True)
+        chunks_added = await asyncio.to_thread(rag_service.index_issues, issues, full_rebuild=True)
         
         # 再インデックス後のコレクション状態を取得
-        from .config import config
-        from .chromadb_admin import ChromaDBAdminService
-        
         admin_service = ChromaDBAdminService(config.chromadb_path)
         collections = admin_service.get_collections()
         collection_info = next((c for c in collections if c["name"] == collection_name), None)
@@ -929,14 +1113,8 @@ async def force_reindex_collection(
 async def clear_index_state(collection_name: str):
     """インデックス状態をクリアして次回の定期更新で強制再構築をトリガー"""
     try:
-        import os
-        from .config import config
-        
-        # インデックス状態ファイルのパス
-        rag_state_path = os.path.join(os.path.dirname(config.chromadb_path), 'rag_index_state.json')
-        
-        if os.path.exists(rag_state_path):
-            os.remove(rag_state_path)
+        if os.path.exists(_RAG_STATE_PATH):
+            os.remove(_RAG_STATE_PATH)
             message = "Index state file removed. Next scheduled update will trigger full rebuild."
         else:
             message = "Index state file did not exist."
@@ -4,22 +4,64 @@ Test script for WebUI advice generation workflow.
 アドバイス再作成機能のWebUIでの動作をテストします。
 """
 
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 import time
 
 BASE_URL = "http://localhost:8000"
 
+# 1つのクライアントで接続を使い回す（keep-alive）
+LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+
+async def fetch_state(client):
+    """Issue一覧とpending adviceを同時に取得します（戻り値: (issues応答, pending advice応答)）"""
+    return await asyncio.gather(
+        client.get("/api/web/issues"),
+        client.get("/api/web/pending-advice"),
+    )
+
+async def wait_for_pending_increase(client, before, timeout=2.0):
+    """pending advice数がbeforeを超えるまで指数バックオフでポーリングします（戻り値: 増えたらTrue）"""
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    headers = {}
+    while True:
+        # ETagを返して条件付きGET（未変更なら304で本文なし）
+        response = await client.get("/api/web/pending-advice", headers=headers)
+        if response.status_code == 200:
+            if orjson.loads(response.content).get('count', 0) > before:
+                return True
+            if etag := response.headers.get('etag'):
+                headers = {'If-None-Match': etag}
+        delay = min(0.02 * 2 ** attempt, 0.2)
+        if time.monotonic() + delay > deadline:
+            return False
+        await asyncio.sleep(delay)
+        attempt += 1
+
 def test_advice_generation_workflow():
     """アドバイス生成ワークフローをテストします"""
-    
+    # pytest は async def のテスト関数を扱えないため、同期関数からイベントループを起動する
+    asyncio.run(_advice_generation_workflow())
+
+async def _advice_generation_workflow():
+    """ワークフローを非同期クライアントで実行"""
     print("=== RemindMine WebUI アドバイス生成ワークフローテスト ===\n")
     
-    # 1. 現在のIssue一覧を取得
+    # アドバイス生成は LLM 呼び出しを含むため長めのタイムアウト
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=LIMITS, timeout=300.0) as client:
+        await _run_workflow(client)
+
+    print("\n=== テスト完了 ===")
+
+async def _run_workflow(client):
+    """ワークフロー本体（各ステップを順に実行）"""
+    # 1. 現在のIssue一覧とpending advice状態をまとめて取得
     print("1. 現在のIssue一覧を取得...")
-    issues_response = requests.get(f"{BASE_URL}/api/web/issues")
+    issues_response, pending_response = await fetch_state(client)
     if issues_response.status_code == 200:
-        issues_data = issues_response.json()
+        issues_data = orjson.loads(issues_response.content)
         issues = issues_data.get('issues', [])
         print(f"   取得したIssue数: {len(issues)}")
         
@@ -31,32 +73,32 @@ def test_advice_generation_workflow():
             
             # 2. アドバイス生成前のpending advice状態を確認
             print("\n2. アドバイス生成前のpending advice状態を確認...")
-            pending_response = requests.get(f"{BASE_URL}/api/web/pending-advice")
             if pending_response.status_code == 200:
-                pending_data = pending_response.json()
+                pending_data = orjson.loads(pending_response.content)
                 pending_count_before = pending_data.get('count', 0)
                 print(f"   生成前のpending advice数: {pending_count_before}")
             
             # 3. アドバイスを生成
             print(f"\n3. Issue #{issue_id} のアドバイスを生成...")
-            advice_response = requests.post(f"{BASE_URL}/api/web/issues/{issue_id}/advice")
+            advice_response = await client.post(f"/api/web/issues/{issue_id}/advice")
             
             if advice_response.status_code == 200:
-                advice_data = advice_response.json()
+                advice_data = orjson.loads(advice_response.content)
                 print(f"   アドバイス生成成功!")
                 print(f"   メッセージ: {advice_data.get('message', 'No message')}")
                 print(f"   advice_id: {advice_data.get('advice_id', 'No ID')}")
                 
-                if advice_data.get('advice'):
-                    advice_text = advice_data['advice'][:100] + "..." if len(advice_data['advice']) > 100 else advice_data['advice']
+                if advice := advice_data.get('advice'):
+                    advice_text = f"{advice[:100]}..." if len(advice) > 100 else advice
                     print(f"   生成されたアドバイス: {advice_text}")
                 
                 # 4. アドバイス生成後のpending advice状態を確認
                 print("\n4. アドバイス生成後のpending advice状態を確認...")
-                time.sleep(1)  # 少し待機
-                pending_response_after = requests.get(f"{BASE_URL}/api/web/pending-advice")
+                # 同じIssueのadviceは置き換えられるため、件数が増えなくてもタイムアウト後に続行
+                await wait_for_pending_increase(client, pending_count_before)
+                updated_issues_response, pending_response_after = await fetch_state(client)
                 if pending_response_after.status_code == 200:
-                    pending_data_after = pending_response_after.json()
+                    pending_data_after = orjson.loads(pending_response_after.content)
                     pending_count_after = pending_data_after.get('count', 0)
                     pending_advice_list = pending_data_after.get('pending_advice', [])
                     
@@ -76,7 +118,6 @@ def test_advice_generation_workflow():
                 
                 # 5. Issue一覧を再取得して画面更新を確認
                 print("\n5. Issue一覧を再取得して画面更新を確認...")
-                updated_issues_response = requests.get(f"{BASE_URL}/api/web/issues")
                 if updated_issues_response.status_code == 200:
                     print("   Issue一覧の更新が正常に完了しました")
                     
@@ -89,14 +130,12 @@ def test_advice_generation_workflow():
             else:
                 print(f"   アドバイス生成失敗: {advice_response.status_code}")
                 if advice_response.headers.get('content-type', '').startswith('application/json'):
-                    error_data = advice_response.json()
+                    error_data = orjson.loads(advice_response.content)
                     print(f"   エラー詳細: {error_data}")
         else:
             print("   テスト対象のIssueが見つかりません")
     else:
         print(f"   Issue一覧取得失敗: {issues_response.status_code}")
 
-    print("\n=== テスト完了 ===")
-
 if __name__ == "__main__":
     test_advice_generation_workflow()
@@ -5,34 +5,26 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from remindmine.redmine_client import RedmineClient
-from remindmine.config import config
+from test_helpers import get_client
 
 def test_fixed_methods():
     """Test the fixed journal retrieval methods."""
     
-    client = RedmineClient(
-        base_url=config.redmine_url,
-        api_key=config.redmine_api_key,
-        disable_proxy=config.disable_proxy,
-        ssl_verify=config.ssl_verify
-    )
+    client = get_client()
     
     print("=== Testing fixed get_all_issues_with_journals (limited test) ===")
     # Test with a small subset to avoid long execution
     # We'll simulate the method with just a few issues
-    issues_list = client.get_issues(limit=3)
+    issues_list = client.get_issues(limit=3, include=None)
     print(f"Found {len(issues_list)} issues")
     
-    issues_with_journals = []
-    for issue in issues_list:
-        issue_id = issue['id']
-        detailed_issue = client.get_issue(issue_id)
-        if detailed_issue:
-            print(f"Issue #{issue_id}: {'✅ Has journals' if 'journals' in detailed_issue else '❌ No journals'}")
-            if 'journals' in detailed_issue:
-                print(f"   Journal count: {len(detailed_issue['journals'])}")
-            issues_with_journals.append(detailed_issue)
+    # Fetch journals for all of them in one bulk request (include=journals);
+    # the client only falls back to per-issue requests if journals are missing
+    issues_with_journals = client.get_issues_by_ids([issue['id'] for issue in issues_list])
+    for detailed_issue in issues_with_journals:
+        print(f"Issue #{detailed_issue['id']}: {'✅ Has journals' if 'journals' in detailed_issue else '❌ No journals'}")
+        if 'journals' in detailed_issue:
+            print(f"   Journal count: {len(detailed_issue['journals'])}")
     
     print(f"\nSuccessfully retrieved {len(issues_with_journals)} issues with journals")
     
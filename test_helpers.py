@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Shared helpers for the manual Redmine test scripts."""
+
+import sys
+import os
+import ssl
+from functools import lru_cache
+import certifi
+import requests
+from requests.adapters import HTTPAdapter
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from remindmine.redmine_client import RedmineClient
+from remindmine.config import config
+
+# Redmine connection settings, read from config once per run
+REDMINE_URL, REDMINE_API_KEY, DISABLE_PROXY, SSL_VERIFY = (
+    config.redmine_url, config.redmine_api_key, config.disable_proxy, config.ssl_verify
+)
+
+
+# Load the CA bundle once and share the context across every session's pool;
+# certifi's bundle is what requests (and so RedmineClient) verifies against
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where()) if SSL_VERIFY else None
+
+
+class _SharedContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose pool manager reuses the module-level SSL context."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        if _SSL_CONTEXT is not None:
+            kwargs['ssl_context'] = _SSL_CONTEXT
+        super().init_poolmanager(*args, **kwargs)
+
+
+def make_session() -> requests.Session:
+    """Return a Redmine API session with pooled connections and the configured SSL/proxy settings."""
+    session = requests.Session()
+    session.headers.update({
+        'X-Redmine-API-Key': REDMINE_API_KEY,
+        'Content-Type': 'application/json'
+    })
+    adapter = _SharedContextAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.verify = SSL_VERIFY
+    if DISABLE_PROXY:
+        session.proxies = {}
+        session.trust_env = False
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_client() -> RedmineClient:
+    """Return one RedmineClient per run so its session and connection pool are reused."""
+    return RedmineClient(
+        base_url=REDMINE_URL,
+        api_key=REDMINE_API_KEY,
+        disable_proxy=DISABLE_PROXY,
+        ssl_verify=SSL_VERIFY
+    )
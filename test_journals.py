@@ -5,19 +5,16 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from remindmine.redmine_client import RedmineClient
-from remindmine.config import config
+from test_helpers import get_client, make_session, REDMINE_URL
 import json
 
+# Raw API calls share one session (keep-alive, API key header set once)
+SESSION = make_session()
+
 def test_journals():
     """Test if journals are being fetched correctly."""
     
-    client = RedmineClient(
-        base_url=config.redmine_url,
-        api_key=config.redmine_api_key,
-        disable_proxy=config.disable_proxy,
-        ssl_verify=config.ssl_verify
-    )
+    client = get_client()
     
     print("=== Testing get_issues method ===")
     # Get a few issues to test
@@ -30,26 +27,27 @@ def test_journals():
     print(f"Retrieved {len(issues)} issues")
     
     for i, issue in enumerate(issues, 1):
-        print(f"\n--- Issue #{issue['id']} ---")
-        print(f"Subject: {issue['subject']}")
+        # Collect the per-issue report and write it in one go
+        lines = [f"\n--- Issue #{issue['id']} ---", f"Subject: {issue['subject']}"]
         
         # Check if journals key exists
         if 'journals' in issue:
             journals = issue['journals']
-            print(f"Journals count: {len(journals)}")
+            lines.append(f"Journals count: {len(journals)}")
             
             # Show details of each journal
             for j, journal in enumerate(journals):
-                print(f"  Journal {j+1}:")
-                print(f"    ID: {journal.get('id', 'N/A')}")
-                print(f"    User: {journal.get('user', {}).get('name', 'N/A')}")
-                print(f"    Created: {journal.get('created_on', 'N/A')}")
-                print(f"    Notes: {journal.get('notes', 'N/A')[:100]}...")
+                lines.append(f"  Journal {j+1}:")
+                lines.append(f"    ID: {journal.get('id', 'N/A')}")
+                lines.append(f"    User: {journal.get('user', {}).get('name', 'N/A')}")
+                lines.append(f"    Created: {journal.get('created_on', 'N/A')}")
+                lines.append(f"    Notes: {journal.get('notes', 'N/A')[:100]}...")
                 if 'details' in journal and journal['details']:
-                    print(f"    Details: {len(journal['details'])} items")
+                    lines.append(f"    Details: {len(journal['details'])} items")
         else:
-            print("❌ No 'journals' key found in issue data")
-            print("Available keys:", list(issue.keys()))
+            lines.append("❌ No 'journals' key found in issue data")
+            lines.append(f"Available keys: {list(issue.keys())}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n=== Testing get_issue method (single issue) ===")
     if issues:
@@ -71,22 +69,15 @@ def test_raw_api():
     """Test raw API call to see what Redmine returns."""
     print("\n=== Testing raw API response ===")
     
-    import requests
-    session = requests.Session()
-    session.headers.update({
-        'X-Redmine-API-Key': config.redmine_api_key,
-        'Content-Type': 'application/json'
-    })
-    
     # Test with explicit include parameter
-    url = f"{config.redmine_url}/issues.json"
+    url = f"{REDMINE_URL}/issues.json"
     params = {
         'limit': 1,
         'include': 'journals'
     }
     
     try:
-        response = session.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
         data = response.json()
         
@@ -5,32 +5,20 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from remindmine.redmine_client import RedmineClient
-from remindmine.config import config
-import requests
+from test_helpers import get_client, make_session, REDMINE_URL
+
+# Raw API calls share one session (keep-alive, API key header set once)
+SESSION = make_session()
 
 def test_api_variations():
     """Test different API variations to understand journal fetching."""
     
-    client = RedmineClient(
-        base_url=config.redmine_url,
-        api_key=config.redmine_api_key,
-        disable_proxy=config.disable_proxy,
-        ssl_verify=config.ssl_verify
-    )
+    client = get_client()
     
     # Use raw requests to test different parameters
-    session = requests.Session()
-    session.headers.update({
-        'X-Redmine-API-Key': config.redmine_api_key,
-        'Content-Type': 'application/json'
-    })
-    session.verify = config.ssl_verify
-    if config.disable_proxy:
-        session.proxies = {}
-        session.trust_env = False
+    session = SESSION
     
-    base_url = config.redmine_url
+    base_url = REDMINE_URL
     
     print("=== Testing API parameter variations ===\n")
     
@@ -93,30 +81,25 @@ def test_api_variations():
 def test_issue_with_comments():
     """Find and test an issue that has comments."""
     
-    client = RedmineClient(
-        base_url=config.redmine_url,
-        api_key=config.redmine_api_key,
-        disable_proxy=config.disable_proxy,
-        ssl_verify=config.ssl_verify
-    )
+    client = get_client()
     
     print("\n=== Looking for issues with comments ===")
     
-    # Get more issues to find one with comments
-    issues = client.get_issues(limit=20, status_id='*')
+    # Get more issues to find one with comments, then fetch their journals in bulk
+    # (get_issues_by_ids falls back per issue when the list endpoint omits journals)
+    issue_list = client.get_issues(limit=20, status_id='*', include=None)
+    issues = client.get_issues_by_ids([issue['id'] for issue in issue_list])
     
     for issue in issues:
         issue_id = issue['id']
-        # Get full issue details
-        full_issue = client.get_issue(issue_id)
-        if full_issue and 'journals' in full_issue:
-            journal_count = len(full_issue['journals'])
+        if 'journals' in issue:
+            journal_count = len(issue['journals'])
             if journal_count > 0:
                 print(f"\nIssue #{issue_id}: {issue['subject']}")
                 print(f"   Journal count: {journal_count}")
                 
                 # Show some journal details
-                for i, journal in enumerate(full_issue['journals'][:3]):  # Show first 3
+                for i, journal in enumerate(issue['journals'][:3]):  # Show first 3
                     notes = journal.get('notes', '').strip()
                     if notes:
                         print(f"   Journal {i+1}: {notes[:50]}...")
@@ -1,11 +1,55 @@
 """Test script for RemindMine Web UI functionality."""
 
 import asyncio
-import aiohttp
-import json
+import httpx
+import orjson
 from datetime import datetime
 
 
+def _json(response):
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+# Tests run concurrently, so let the pool keep enough connections open
+_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+
+# Process-wide client so repeated main() calls on one event loop reuse the keep-alive pool.
+# Pooled connections belong to the loop that opened them: the client is closed when
+# that loop shuts down, and a later loop (e.g. the next asyncio.run) gets a new one.
+_CLIENT = None
+_CLIENT_LOOP = None
+_CLIENT_CLOSER = None
+
+
+async def _close_when_loop_ends(client):
+    """Wait until the event loop cancels this task on shutdown, then close the client."""
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+
+async def get_client():
+    """Return the shared AsyncClient for the running event loop, creating it on first use."""
+    global _CLIENT, _CLIENT_LOOP, _CLIENT_CLOSER
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        _CLIENT = httpx.AsyncClient(limits=_LIMITS)
+        _CLIENT_LOOP = loop
+        _CLIENT_CLOSER = loop.create_task(_close_when_loop_ends(_CLIENT))
+    return _CLIENT
+
+
+async def shutdown():
+    """Close the shared client now (it is otherwise closed when its event loop ends)."""
+    global _CLIENT, _CLIENT_LOOP, _CLIENT_CLOSER
+    if _CLIENT_CLOSER is not None and _CLIENT_LOOP is asyncio.get_running_loop():
+        _CLIENT_CLOSER.cancel()
+        await asyncio.gather(_CLIENT_CLOSER, return_exceptions=True)
+    _CLIENT = _CLIENT_LOOP = _CLIENT_CLOSER = None
+
+
 class WebUITester:
     """Test class for Web UI endpoints."""
     
@@ -14,120 +58,125 @@ class WebUITester:
         self.session = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = await get_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared client outlives the tester; shutdown() closes it
+        pass
     
     async def test_health_check(self):
         """Test health check endpoint."""
         print("🔍 Testing health check...")
-        async with self.session.get(f"{self.base_url}/health") as response:
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ Health check passed: {data['status']}")
-                return True
-            else:
-                print(f"❌ Health check failed: {response.status}")
-                return False
+        response = await self.session.get(f"{self.base_url}/health")
+        if response.status_code == 200:
+            data = _json(response)
+            print(f"✅ Health check passed: {data['status']}")
+            return True
+        else:
+            print(f"❌ Health check failed: {response.status_code}")
+            return False
     
     async def test_web_dashboard(self):
         """Test web dashboard access."""
         print("🌐 Testing web dashboard...")
-        async with self.session.get(f"{self.base_url}/") as response:
-            if response.status == 200:
-                content = await response.text()
-                if "RemindMine AI Agent" in content:
-                    print("✅ Web dashboard loaded successfully")
-                    return True
-                else:
-                    print("❌ Web dashboard content invalid")
-                    return False
+        async with self.session.stream("GET", f"{self.base_url}/") as response:
+            if response.status_code == 200:
+                # Stop reading as soon as the page title has been seen
+                needle = "RemindMine AI Agent".encode()
+                tail = b""
+                async for chunk in response.aiter_bytes(4096):
+                    window = tail + chunk
+                    if needle in window:
+                        print("✅ Web dashboard loaded successfully")
+                        return True
+                    # Keep enough bytes to match a title split across chunks
+                    tail = window[-(len(needle) - 1):]
+                print("❌ Web dashboard content invalid")
+                return False
             else:
-                print(f"❌ Web dashboard failed to load: {response.status}")
+                print(f"❌ Web dashboard failed to load: {response.status_code}")
                 return False
     
     async def test_issues_api(self):
         """Test issues API endpoint."""
         print("📋 Testing issues API...")
-        async with self.session.get(f"{self.base_url}/api/web/issues") as response:
-            if response.status == 200:
-                data = await response.json()
-                issues_count = len(data.get('issues', []))
-                print(f"✅ Issues API returned {issues_count} issues")
-                return True
-            else:
-                print(f"❌ Issues API failed: {response.status}")
-                return False
+        response = await self.session.get(f"{self.base_url}/api/web/issues")
+        if response.status_code == 200:
+            data = _json(response)
+            issues_count = len(data.get('issues', []))
+            print(f"✅ Issues API returned {issues_count} issues")
+            return True
+        else:
+            print(f"❌ Issues API failed: {response.status_code}")
+            return False
     
     async def test_projects_api(self):
         """Test projects API endpoint."""
         print("🏗️ Testing projects API...")
-        async with self.session.get(f"{self.base_url}/api/web/projects") as response:
-            if response.status == 200:
-                data = await response.json()
-                projects_count = len(data)
-                print(f"✅ Projects API returned {projects_count} projects")
-                return True
-            else:
-                print(f"❌ Projects API failed: {response.status}")
-                return False
+        response = await self.session.get(f"{self.base_url}/api/web/projects")
+        if response.status_code == 200:
+            data = _json(response)
+            projects_count = len(data)
+            print(f"✅ Projects API returned {projects_count} projects")
+            return True
+        else:
+            print(f"❌ Projects API failed: {response.status_code}")
+            return False
     
     async def test_settings_api(self):
         """Test settings API endpoints."""
         print("⚙️ Testing settings API...")
         
         # Test GET settings
-        async with self.session.get(f"{self.base_url}/api/web/settings") as response:
-            if response.status == 200:
-                settings = await response.json()
-                print(f"✅ Settings GET successful: auto_advice={settings.get('auto_advice_enabled')}")
-                
-                # Test POST settings (toggle auto-advice)
-                new_state = not settings.get('auto_advice_enabled', True)
-                async with self.session.post(
-                    f"{self.base_url}/api/web/settings/auto-advice",
-                    json={"enabled": new_state}
-                ) as post_response:
-                    if post_response.status == 200:
-                        result = await post_response.json()
-                        print(f"✅ Settings POST successful: auto_advice={result.get('enabled')}")
-                        
-                        # Restore original state
-                        await self.session.post(
-                            f"{self.base_url}/api/web/settings/auto-advice",
-                            json={"enabled": settings.get('auto_advice_enabled', True)}
-                        )
-                        return True
-                    else:
-                        print(f"❌ Settings POST failed: {post_response.status}")
-                        return False
-            else:
-                print(f"❌ Settings GET failed: {response.status}")
-                return False
+        response = await self.session.get(f"{self.base_url}/api/web/settings")
+        if response.status_code != 200:
+            print(f"❌ Settings GET failed: {response.status_code}")
+            return False
+        settings = _json(response)
+        print(f"✅ Settings GET successful: auto_advice={settings.get('auto_advice_enabled')}")
+        
+        # Test POST settings (toggle auto-advice)
+        new_state = not settings.get('auto_advice_enabled', True)
+        post_response = await self.session.post(
+            f"{self.base_url}/api/web/settings/auto-advice",
+            json={"enabled": new_state}
+        )
+        if post_response.status_code != 200:
+            print(f"❌ Settings POST failed: {post_response.status_code}")
+            return False
+        result = _json(post_response)
+        print(f"✅ Settings POST successful: auto_advice={result.get('enabled')}")
+        
+        # Restore original state
+        await self.session.post(
+            f"{self.base_url}/api/web/settings/auto-advice",
+            json={"enabled": settings.get('auto_advice_enabled', True)}
+        )
+        return True
     
     async def test_static_files(self):
         """Test static file serving."""
         print("📁 Testing static files...")
         
-        # Test CSS
-        async with self.session.get(f"{self.base_url}/static/css/style.css") as response:
-            if response.status == 200:
-                print("✅ CSS file loaded successfully")
-            else:
-                print(f"❌ CSS file failed to load: {response.status}")
-                return False
+        # Test CSS and JavaScript together
+        css_response, js_response = await asyncio.gather(
+            self.session.get(f"{self.base_url}/static/css/style.css"),
+            self.session.get(f"{self.base_url}/static/js/app.js"),
+        )
         
-        # Test JavaScript
-        async with self.session.get(f"{self.base_url}/static/js/app.js") as response:
-            if response.status == 200:
-                print("✅ JavaScript file loaded successfully")
-                return True
-            else:
-                print(f"❌ JavaScript file failed to load: {response.status}")
-                return False
+        if css_response.status_code == 200:
+            print("✅ CSS file loaded successfully")
+        else:
+            print(f"❌ CSS file failed to load: {css_response.status_code}")
+            return False
+        
+        if js_response.status_code == 200:
+            print("✅ JavaScript file loaded successfully")
+            return True
+        else:
+            print(f"❌ JavaScript file failed to load: {js_response.status_code}")
+            return False
     
     async def run_all_tests(self):
         """Run all tests and report results."""
@@ -143,15 +192,19 @@ class WebUITester:
             ("Static Files", self.test_static_files),
         ]
         
+        # The tests are independent, so run them concurrently over the shared session
+        outcomes = await asyncio.gather(
+            *(test_func() for _, test_func in tests),
+            return_exceptions=True
+        )
+        
         results = []
-        for test_name, test_func in tests:
-            try:
-                result = await test_func()
-                results.append((test_name, result))
-            except Exception as e:
-                print(f"❌ {test_name} crashed: {e}")
-                results.append((test_name, False))
-            print()
+        for (test_name, _), outcome in zip(tests, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ {test_name} crashed: {outcome}")
+                outcome = False
+            results.append((test_name, outcome))
+        print()
         
         # Summary
         print("=" * 50)